@@ -2,18 +2,17 @@
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from .const import CONF_ZONES, DEBOUNCE_DELAY, DOMAIN
 from .master_controller import MasterController
 
-DOMAIN = "my_opentherm_controller"
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MasterController from a config entry (UI setup)."""
     
     # 1. Load configuration from the UI entry
-    zone_configs = entry.data.get("zones", [])
+    zone_configs = entry.data.get(CONF_ZONES, [])
     
     # 2. Instantiate and store the controller
-    controller = MasterController(hass, zone_configs)
+    controller = MasterController(hass, zone_configs, debounce_delay=DEBOUNCE_DELAY)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = controller
     
     # 3. Start listening to events
@@ -23,6 +22,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of a config entry."""
-    # This is required to clean up event listeners when the component is removed via the UI.
-    # The listeners would need to be stored in the controller instance for cleanup.
+    # Clean up event listeners when the component is removed or reloaded via the UI.
+    controller = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    if controller is not None:
+        await controller.async_stop_listening()
     return True
@@ -1,44 +1,76 @@
 import logging
+from typing import Any, Optional
+
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
+from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
-_LOGGER = logging.getLogger(__name__)
+from .const import (
+    CONF_AREA,
+    CONF_ENTITY_ID,
+    CONF_NAME,
+    CONF_PRIORITY,
+    CONF_TRV_ENTITY_ID,
+    CONF_ZONES,
+    DOMAIN,
+)
 
-DOMAIN = "my_opentherm_controller"
+_LOGGER = logging.getLogger(__name__)
 
-# Configuration keys
-CONF_ENTITY_ID = "entity_id"  # Climate entity to control
-CONF_NAME = "name"            # Zone name
-CONF_AREA = "area"            # Zone floor area in m²
-CONF_PRIORITY = "priority"    # Zone priority (0.0-1.0)
-CONF_TRV_ENTITY_ID = "trv_entity_id"  # Optional TRV valve opening % entity
 
-# Define the data schema for the zone configuration
-# This defines the structure of data for each zone
-DATA_SCHEMA = vol.Schema({
-    # Use EntitySelector for searchable dropdown (filter to climate entities)
-    vol.Required(CONF_ENTITY_ID): selector.EntitySelector(
-        selector.EntitySelectorConfig(domain="climate")
-    ),
-    
-    vol.Optional(CONF_NAME): str,
-    vol.Optional(CONF_AREA, default=0.0): vol.Coerce(float),
+def _build_zone_schema(configured_zones: list[dict]) -> vol.Schema:
+    """
+    Build the zone form schema, hiding entities already used by configured zones.
     
-    # Priority weighting: controls how much this zone influences boiler decisions
-    # 1.0 = normal (default), 0.5 = half importance, 0.1 = low importance
-    vol.Optional(CONF_PRIORITY, default=1.0): vol.All(
-        vol.Coerce(float), 
-        vol.Range(min=0.0, max=1.0)
-    ),
+    The climate dropdown shrinks with each added zone, and a TRV already tracked
+    by another zone is not offered again.
+    """
+    used_climate_ids = [zone[CONF_ENTITY_ID] for zone in configured_zones]
+    used_trv_ids = [zone[CONF_TRV_ENTITY_ID] for zone in configured_zones if zone.get(CONF_TRV_ENTITY_ID)]
     
-    # Optional TRV valve opening % entity for mitigation of closing valves
-    # Typically a number entity that reports 0-100% opening
-    vol.Optional(CONF_TRV_ENTITY_ID): selector.EntitySelector(
-        selector.EntitySelectorConfig(domain="number")
-    ),
+    return vol.Schema({
+        # Use EntitySelector for searchable dropdown (filter to climate entities)
+        vol.Required(CONF_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="climate",
+                multiple=False,
+                exclude_entities=used_climate_ids,
+            )
+        ),
+        
+        vol.Optional(CONF_NAME): str,
+        vol.Optional(CONF_AREA, default=0.0): vol.Coerce(float),
+        
+        # Priority weighting: controls how much this zone influences boiler decisions
+        # 1.0 = normal (default), 0.5 = half importance, 0.1 = low importance
+        vol.Optional(CONF_PRIORITY, default=1.0): vol.All(
+            vol.Coerce(float), 
+            vol.Range(min=0.0, max=1.0)
+        ),
+        
+        # Optional TRV valve opening % entity for mitigation of closing valves
+        # Typically a number entity that reports 0-100% opening
+        vol.Optional(CONF_TRV_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="number",
+                multiple=False,
+                exclude_entities=used_trv_ids,
+            )
+        ),
+    })
+
+
+# Define the data schema for the zone configuration
+# This defines the structure of data for each zone (first zone: nothing to exclude yet)
+DATA_SCHEMA = _build_zone_schema([])
+
+# Schema for the "add another zone?" step
+# Built once at import time instead of on every step invocation
+ADD_ANOTHER_SCHEMA = vol.Schema({
+    vol.Required("add_another", default=True): bool
 })
 
 
@@ -56,10 +88,14 @@ class OpenThermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_PUSH
 
-    # Internal list to store zone configurations as the user adds them
-    _zones_config = [] 
+    def __init__(self) -> None:
+        """Initialize the config flow with an empty zone list."""
+        super().__init__()
+        # Zone configurations collected as the user adds them
+        # Per-instance so concurrent or repeated flows never share zones
+        self._zones_config: list[dict] = []
 
-    async def async_step_user(self, user_input=None):
+    async def async_step_user(self, user_input: Optional[dict[str, Any]] = None) -> FlowResult:
         """
         Handle the initial step when the user adds the component.
         
@@ -71,7 +107,7 @@ class OpenThermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         - Select TRV valve opening entity (optional)
         """
         
-        errors = {}
+        errors: dict[str, str] = {}
 
         if user_input is not None:
             # Validate and store the configuration
@@ -83,12 +119,12 @@ class OpenThermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Initial form shown to the user
         return self.async_show_form(
             step_id="user",
-            data_schema=DATA_SCHEMA,
+            data_schema=_build_zone_schema(self._zones_config) if self._zones_config else DATA_SCHEMA,
             errors=errors,
             description_placeholders={"count": len(self._zones_config)}
         )
 
-    async def async_step_add_another(self, user_input=None):
+    async def async_step_add_another(self, user_input: Optional[dict[str, Any]] = None) -> FlowResult:
         """
         Ask the user if they want to add another zone.
         
@@ -105,14 +141,12 @@ class OpenThermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # If no, finalize the configuration with all collected zones
             return self.async_create_entry(
                 title="OpenTherm MasterController",
-                data={"zones": self._zones_config},  # Save the final list of zones
+                data={CONF_ZONES: self._zones_config},  # Save the final list of zones
             )
 
         # Form to ask if more zones are needed
         return self.async_show_form(
             step_id="add_another",
-            data_schema=vol.Schema({
-                vol.Required("add_another", default=True): bool
-            }),
+            data_schema=ADD_ANOTHER_SCHEMA,
             description_placeholders={"current_count": len(self._zones_config)}
         )
@@ -0,0 +1,48 @@
+"""
+Constants shared by the OpenTherm MasterController integration.
+
+Single definition point for the integration domain, config entry keys and
+boiler control limits used by __init__.py, config_flow.py and master_controller.py.
+"""
+
+from typing import Final
+
+DOMAIN: Final = "my_opentherm_controller"
+
+# =========================================================
+# Configuration Keys
+# =========================================================
+
+CONF_ZONES: Final = "zones"                  # List of zone configurations in the config entry
+CONF_ENTITY_ID: Final = "entity_id"          # Climate entity to control
+CONF_NAME: Final = "name"                    # Zone name
+CONF_AREA: Final = "area"                    # Zone floor area in m²
+CONF_PRIORITY: Final = "priority"            # Zone priority (0.0-1.0)
+CONF_TRV_ENTITY_ID: Final = "trv_entity_id"  # Optional TRV valve opening % entity
+
+# =========================================================
+# OpenTherm Control Constants
+# =========================================================
+
+# Entity ID where OpenTherm flow temperature is set (Home Assistant number entity)
+OPEN_THERM_FLOW_TEMP_ENTITY: Final = "number.opentherm_flow_temp"
+
+# Flow temperature commanded for a PID output of zero (flow_temp = BASE_FLOW_TEMP + PID output)
+BASE_FLOW_TEMP: Final = 40.0
+
+# Flow temperature = 5°C is boiler OFF signal (minimum safe temperature)
+MIN_FLOW_TEMP: Final = 5.0
+
+# Flow temperature = 80°C is maximum boiler output (safety limit)
+MAX_FLOW_TEMP: Final = 80.0
+
+# Flow temperature changes smaller than this (°C) are not sent to the boiler
+# Sensor jitter often resolves to the same command; skipping it avoids redundant service calls
+FLOW_TEMP_DEADBAND: Final = 0.1
+
+# Unchanged flow temperatures are still re-sent after this many seconds, so a boiler
+# that missed or reset its setpoint is corrected without waiting for a real change
+FLOW_TEMP_REFRESH_INTERVAL: Final = 30.0
+
+# Quiet period (seconds) used to coalesce bursts of state changes into one recalculation
+DEBOUNCE_DELAY: Final = 0.5
@@ -33,32 +33,172 @@ Orchestrates heating across multiple zones (rooms) using a PID controller:
 - Commands OpenTherm boiler to maintain comfort while optimizing energy
 """
 
+import asyncio
+import heapq
+import itertools
 import logging
-import time
-from typing import TYPE_CHECKING, Optional
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Optional
 
-try:
+# Relative imports inside Home Assistant; top-level imports when loaded as a
+# plain module (unit tests put this directory on sys.path)
+if __package__:
+    from .const import (
+        BASE_FLOW_TEMP,
+        CONF_AREA,
+        CONF_ENTITY_ID,
+        CONF_NAME,
+        CONF_PRIORITY,
+        CONF_TRV_ENTITY_ID,
+        FLOW_TEMP_DEADBAND,
+        FLOW_TEMP_REFRESH_INTERVAL,
+        MAX_FLOW_TEMP,
+        MIN_FLOW_TEMP,
+        OPEN_THERM_FLOW_TEMP_ENTITY,
+    )
     from .zone_wrapper import ZoneWrapper
-except ImportError:
+else:
+    from const import (
+        BASE_FLOW_TEMP,
+        CONF_AREA,
+        CONF_ENTITY_ID,
+        CONF_NAME,
+        CONF_PRIORITY,
+        CONF_TRV_ENTITY_ID,
+        FLOW_TEMP_DEADBAND,
+        FLOW_TEMP_REFRESH_INTERVAL,
+        MAX_FLOW_TEMP,
+        MIN_FLOW_TEMP,
+        OPEN_THERM_FLOW_TEMP_ENTITY,
+    )
     from zone_wrapper import ZoneWrapper
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
+
+# Control constants live in const.py (they remain importable from this module)
+__all__ = ["MasterController"]
 
 _LOGGER = logging.getLogger("don_controller")
 
-# =========================================================
-# OpenTherm Control Constants
-# =========================================================
+# Climate attributes read by ZoneWrapper.update_from_state; changes to any other
+# attribute (friendly_name, icons, ...) cannot affect the boiler command
+_TRACKED_ATTRIBUTES = ("current_temperature", "temperature", "hvac_action")
+
+# Entity states carrying no usable readings (homeassistant.const STATE_UNAVAILABLE / STATE_UNKNOWN)
+_UNAVAILABLE_STATES = frozenset(("unavailable", "unknown"))
+
+# Per-zone status lines logged by _compute_flow_temp at debug level
+_ZONE_STATUS_LOG = (
+    "Zone '%s': [%s-priority] demanding=%s, error=%.1f°C, priority=%.2f, demand_metric=%.2f°C"
+)
+_ZONE_STATUS_TRV_LOG = _ZONE_STATUS_LOG + ", TRV=%.0f%%"
+
+
+def _clamp_flow_temp(flow_temp: float) -> float:
+    """Clamp to MIN_FLOW_TEMP .. MAX_FLOW_TEMP; NaN falls back to MIN_FLOW_TEMP (boiler OFF)."""
+    if MIN_FLOW_TEMP <= flow_temp <= MAX_FLOW_TEMP:
+        return flow_temp
+    return MAX_FLOW_TEMP if flow_temp > MAX_FLOW_TEMP else MIN_FLOW_TEMP
 
-# Entity ID where OpenTherm flow temperature is set (Home Assistant number entity)
-OPEN_THERM_FLOW_TEMP_ENTITY = "number.opentherm_flow_temp"
 
-# Flow temperature = 5°C is boiler OFF signal (minimum safe temperature)
-MIN_FLOW_TEMP = 5.0
+def _is_relevant_state_change(event_data: Mapping[str, Any]) -> bool:
+    """
+    Return False for no-op writes and attribute-only changes irrelevant to the control loop.
+    
+    Runs in the event loop before any handler task is created, so it must stay
+    synchronous and cheap. TRV entities are covered through their state value.
+    """
+    old_state = event_data.get('old_state')
+    new_state = event_data.get('new_state')
+    if not old_state or not new_state or old_state.state != new_state.state:
+        return True
+    
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    return any(old_attributes.get(name) != new_attributes.get(name) for name in _TRACKED_ATTRIBUTES)
+
 
-# Flow temperature = 80°C is maximum boiler output (safety limit)
-MAX_FLOW_TEMP = 80.0
+class _DemandIndex:
+    """
+    Max-heap of zone demand metrics for one priority group.
+    
+    Only zones whose state changed are re-keyed, so finding the max-demand zone
+    no longer requires scanning every zone on every event:
+    - update(): O(log N) push of the zone's new demand metric
+    - best(): O(1) amortized lookup of the zone with the largest demand
+    
+    Each push supersedes the zone's previous entry; stale entries are discarded
+    lazily when they reach the top of the heap. Updates that leave a zone's
+    demand unchanged push nothing. Ties are broken by zone configuration order,
+    matching a linear scan over the zones.
+    """
+
+    __slots__ = ("_zones", "_order", "_heap", "_live", "_keyed", "_sequence", "_demanding")
+
+    def __init__(self, zones: Iterable[ZoneWrapper]) -> None:
+        self._zones: tuple[ZoneWrapper, ...] = tuple(zones)
+        self._order: dict[str, int] = {zone.entity_id: i for i, zone in enumerate(self._zones)}
+        
+        # Heap entries: (-demand_metric, zone_order, sequence)
+        self._heap: list[tuple[float, int, int]] = []
+        # Sequence number of each zone's live heap entry, indexed by zone order
+        # (parallel to _zones; -1 = no entry yet)
+        self._live: list[int] = [-1] * len(self._zones)
+        # Demand each zone is currently keyed under (0.0 = no live entry), indexed by zone order
+        self._keyed: list[float] = [0.0] * len(self._zones)
+        self._sequence: Iterator[int] = itertools.count()
+        
+        # Entity IDs of zones in this group that are actively heating
+        self._demanding: set[str] = set()
+
+    @property
+    def demanding_count(self) -> int:
+        """Number of zones in this group that are actively calling for heat."""
+        return len(self._demanding)
+
+    def update(self, zone: ZoneWrapper) -> None:
+        """Re-key a zone after its state changed."""
+        if zone.is_demanding_heat:
+            self._demanding.add(zone.entity_id)
+        else:
+            self._demanding.discard(zone.entity_id)
+        
+        # Same demand as its live entry (e.g. an idle zone re-reporting): the heap is still valid
+        order = self._order[zone.entity_id]
+        demand = zone.demand_metric
+        if demand == self._keyed[order]:
+            return
+        
+        sequence = next(self._sequence)
+        self._live[order] = sequence
+        
+        # Zones without positive demand never win, so they only invalidate their old entry
+        self._keyed[order] = demand if demand > 0 else 0.0
+        if demand > 0:
+            heapq.heappush(self._heap, (-demand, order, sequence))
+        
+        # Compact if stale entries pile up behind a long-standing max
+        if len(self._heap) > 4 * len(self._zones) + 16:
+            self._heap = [entry for entry in self._heap if self._live[entry[1]] == entry[2]]
+            heapq.heapify(self._heap)
+
+    def clear(self) -> None:
+        """Forget every zone's demand, as if no zone had reported yet."""
+        self._heap.clear()
+        self._live[:] = [-1] * len(self._zones)
+        self._keyed[:] = [0.0] * len(self._zones)
+        self._demanding.clear()
+
+    def best(self) -> Optional[tuple[ZoneWrapper, float]]:
+        """Return (zone, demand_metric) of the max-demand zone, or None if no zone has demand."""
+        heap = self._heap
+        while heap:
+            neg_demand, order, sequence = heap[0]
+            if self._live[order] == sequence:
+                return self._zones[order], -neg_demand
+            heapq.heappop(heap)
+        return None
 
 
 class MasterController:
@@ -77,7 +217,34 @@ class MasterController:
     - This approach prioritizes the most uncomfortable zone while serving all zones
     """
 
-    def __init__(self, hass: "HomeAssistant", zone_configs: list[dict]) -> None:
+    # Fixed attribute layout: no per-instance __dict__, slot-indexed attribute access
+    __slots__ = (
+        "hass",
+        "zones",
+        "zones_list",
+        "monitored_entity_ids",
+        "_debounce_delay",
+        "_debounce_handle",
+        "_debounce_deadline",
+        "_debounce_extended",
+        "_last_flow_temp",
+        "_last_flow_temp_ts",
+        "_pending_flow_temp",
+        "_flush_task",
+        "_unsub",
+        "_unavailable",
+        "_monitored",
+        "_zone_get",
+        "_trv_index",
+        "_high_priority_zones",
+        "_low_priority_zones",
+        "_high_priority_demand",
+        "_low_priority_demand",
+        "_demand_index_by_zone",
+    )
+
+    def __init__(self, hass: "HomeAssistant", zone_configs: list[dict],
+                 debounce_delay: float = 0.0) -> None:
         """
         Initialize the master controller with zone configuration.
         
@@ -92,122 +259,328 @@ class MasterController:
                   * 0.5 = medium importance, half demand
                   * 0.1 = low importance, aggregated to prevent cycling
                 - trv_entity_id: TRV valve opening % entity for mitigation (optional)
+            debounce_delay: Quiet period in seconds before recalculating after a state change
+                (0.0 = recalculate immediately on every event)
         """
         self.hass = hass
-        self.zones: dict[str, ZoneWrapper] = {}
         
-        _LOGGER.info("MasterController initializing with %d zones", len(zone_configs))
-        
-        # Instantiate ZoneWrapper for each configured zone
-        for config in zone_configs:
-            entity_id = config['entity_id']
-            zone_name = config.get('name', entity_id)
-            area = config.get('area', 0.0)
-            priority = config.get('priority', 1.0)  # Default: normal priority
-            trv_entity_id = config.get('trv_entity_id', None)  # Optional TRV tracking
-            
-            # Create zone wrapper with PID controller and priority
-            self.zones[entity_id] = ZoneWrapper(
-                entity_id=entity_id, 
-                name=zone_name,
-                floor_area_m2=area,
-                priority=priority,
-                trv_entity_id=trv_entity_id
-            )
-            _LOGGER.info(
-                "MasterController: Registered zone '%s' (%s, area=%.1f m², priority=%.2f%s)", 
-                zone_name, entity_id, area, priority,
-                f", TRV tracking" if trv_entity_id else ""
+        # Debounce state: pending recalculation timer, its delay, the loop time it fires at
+        # and whether events arrived after the timer was armed
+        self._debounce_delay = debounce_delay
+        self._debounce_handle: Optional[asyncio.TimerHandle] = None
+        self._debounce_deadline: float = 0.0
+        self._debounce_extended: bool = False
+        
+        # Last flow temperature sent to the boiler (None = nothing sent yet)
+        self._last_flow_temp: Optional[float] = None
+        # Monotonic clock reading of when it was sent
+        self._last_flow_temp_ts: float = 0.0
+        
+        # Single-slot command batcher (debounced mode): latest flow temperature not yet
+        # written, and the task draining it (None = no write in flight)
+        self._pending_flow_temp: Optional[float] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Unsubscribe callback of the state change listener (None = not listening)
+        self._unsub: Optional[Callable[[], None]] = None
+        
+        # Monitored entities currently unavailable/unknown (their last good readings are kept)
+        self._unavailable: set[str] = set()
+        
+        # Instantiate ZoneWrapper (with PID controller and priority) for each configured zone
+        # Defaults: name = entity_id, area = 0.0, priority = 1.0 (normal), no TRV tracking
+        self.zones: dict[str, ZoneWrapper] = {
+            config[CONF_ENTITY_ID]: ZoneWrapper(
+                entity_id=config[CONF_ENTITY_ID],
+                name=config.get(CONF_NAME, config[CONF_ENTITY_ID]),
+                floor_area_m2=config.get(CONF_AREA, 0.0),
+                priority=config.get(CONF_PRIORITY, 1.0),
+                trv_entity_id=config.get(CONF_TRV_ENTITY_ID),
             )
+            for config in zone_configs
+        }
+        
+        # Zones in configuration order, for passes over every zone (no dict iterator per pass)
+        self.zones_list: tuple[ZoneWrapper, ...] = tuple(self.zones.values())
+        
+        # One summary line at startup; per-zone details only when debugging
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("MasterController registered %d zones: %s", len(self.zones), list(self.zones))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for zone in self.zones_list:
+                _LOGGER.debug(
+                    "MasterController: Registered zone '%s' (%s, area=%.1f m², priority=%.2f%s)",
+                    zone.name, zone.entity_id, zone.floor_area_m2, zone.priority,
+                    ", TRV tracking" if zone.trv_entity_id else ""
+                )
+        
+        # Reverse index: TRV entity ID -> zone it belongs to (O(1) lookup for TRV events)
+        self._trv_index: dict[str, ZoneWrapper] = {
+            zone.trv_entity_id: zone for zone in self.zones_list if zone.trv_entity_id
+        }
         
         # List of all entities to monitor for Home Assistant state change events
         # This includes both climate entities and optional TRV entities
-        self.monitored_entity_ids = list(self.zones.keys())
+        self.monitored_entity_ids: list[str] = list(self.zones) + list(self._trv_index)
         
-        # Add TRV entities to monitoring list
-        for zone in self.zones.values():
-            if zone.trv_entity_id:
-                self.monitored_entity_ids.append(zone.trv_entity_id)
+        # Frozen copy for O(1) membership checks in the event handler, plus a bound
+        # zone lookup so the hot path skips the attribute and method lookups
+        self._monitored: frozenset[str] = frozenset(self.monitored_entity_ids)
+        self._zone_get: Callable[[str], Optional[ZoneWrapper]] = self.zones.get
+        
+        # Zones partitioned once by priority group (a zone's priority never changes)
+        # HIGH priority (priority > 0.5) and LOW priority (priority <= 0.5)
+        self._high_priority_zones: tuple[ZoneWrapper, ...] = tuple(
+            zone for zone in self.zones_list if zone.priority > 0.5
+        )
+        self._low_priority_zones: tuple[ZoneWrapper, ...] = tuple(
+            zone for zone in self.zones_list if zone.priority <= 0.5
+        )
+        
+        # Max-demand index per priority group, re-keyed only for zones that change
+        self._high_priority_demand = _DemandIndex(self._high_priority_zones)
+        self._low_priority_demand = _DemandIndex(self._low_priority_zones)
+        self._demand_index_by_zone: dict[str, _DemandIndex] = {
+            **{zone.entity_id: self._high_priority_demand for zone in self._high_priority_zones},
+            **{zone.entity_id: self._low_priority_demand for zone in self._low_priority_zones},
+        }
 
-    async def async_start_listening(self):
+    async def async_start_listening(self) -> None:
         """
         Start listening for state change events on all monitored zones.
         
         Sets up Home Assistant state change event listener that will call
-        _async_hvac_demand_change whenever a zone's climate entity changes state.
+        _handle_state_changed whenever a zone's climate entity changes state.
+        Events that leave the control inputs unchanged are dropped by a synchronous
+        filter, and relevant ones are handled inline (no task per event).
+        Calling it again while already listening is a no-op (one listener, one unsub).
         """
+        if self._unsub is not None:
+            _LOGGER.debug("MasterController is already listening.")
+            return
+
+        # Imported here so the controller can be loaded without Home Assistant (unit tests)
+        from homeassistant.core import callback
+        from homeassistant.helpers.event import async_track_state_change_event
+        
         _LOGGER.info("MasterController starting to listen to %s zones.", len(self.zones))
         
+        @callback
+        def _async_state_changed(event: "Event") -> None:
+            self._handle_state_changed(event)
+        
         # Listen for state changes on all zone climate entities
-        # Each state change triggers _async_hvac_demand_change event handler
-        self.hass.helpers.event.async_track_state_change_event(
+        # Each relevant state change updates its zone and triggers a boiler recalculation
+        self._unsub = async_track_state_change_event(
+            self.hass,
             self.monitored_entity_ids,
-            self._async_hvac_demand_change
+            _async_state_changed
         )
+
+    async def async_stop_listening(self) -> None:
+        """
+        Stop listening for state change events and cancel any pending recalculation.
+        
+        Must be called when the config entry is unloaded, otherwise the listener
+        stays registered across Home Assistant reloads.
+        """
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+            self._debounce_extended = False
+        
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending_flow_temp = None
+        
+        _LOGGER.info("MasterController stopped listening.")
         
-    async def _async_hvac_demand_change(self, event) -> None:
+    def _handle_state_changed(self, event: "Event") -> None:
+        """
+        Listener body (runs inside the @callback registered by async_start_listening).
+        
+        Relevant state changes are applied and recalculated inline; only the boiler
+        write is handed to the fire-and-forget batcher, so no task is created per event.
+        """
+        if not _is_relevant_state_change(event.data) or not self._hvac_demand_change(event):
+            return
+        flow_temp = self._recalculate()
+        if flow_temp is not None:
+            self._dispatch_flow_temp(flow_temp)
+
+    async def _async_hvac_demand_change(self, event: "Event") -> None:
         """
         Event handler: Called when any monitored entity's state changes.
         
+        Applies the state change to its zone (see _hvac_demand_change), then
+        triggers boiler control logic recalculation.
+        When debouncing is enabled, bursts of events are coalesced into a single
+        recalculation once the zones have been quiet for the debounce delay.
+        
+        Args:
+            event: Home Assistant state change event containing entity_id and new_state
+        """
+        if not self._hvac_demand_change(event):
+            return
+        
+        # Recalculate boiler command based on all zones' current states
+        flow_temp = self._recalculate()
+        if flow_temp is not None:
+            await self.async_set_opentherm_flow_temp(flow_temp)
+
+    async def _async_hvac_demand_change_batch(self, events: Iterable["Event"]) -> None:
+        """
+        Apply several state changes, then recalculate at most once.
+        
+        Every event is applied to its zone first (see _hvac_demand_change), so the
+        single recalculation sees all of them: one PID pass and at most one boiler
+        command instead of one per event. Debounced mode schedules one recalculation.
+        
+        Args:
+            events: Home Assistant state change events, applied in order
+        """
+        significant = False
+        for event in events:
+            if self._hvac_demand_change(event):
+                significant = True
+        if not significant:
+            return
+        
+        flow_temp = self._recalculate()
+        if flow_temp is not None:
+            await self.async_set_opentherm_flow_temp(flow_temp)
+
+    def _hvac_demand_change(self, event: "Event") -> bool:
+        """
+        Apply a monitored entity's state change to its zone (synchronous, no I/O).
+        
         Handles both climate entity changes and TRV valve opening updates:
         - Climate entity change: Updates temperature, target, HVAC action
         - TRV opening change: Updates valve opening % for demand mitigation
         
-        After any state change, triggers boiler control logic recalculation.
-        
         Args:
             event: Home Assistant state change event containing entity_id and new_state
+            
+        Returns:
+            bool: True if a zone changed materially and the boiler command must be recalculated
+                  (zone state and demand index are updated either way)
         """
         entity_id = event.data.get('entity_id')
         new_state = event.data.get('new_state')
         
+        if entity_id not in self._monitored:
+            _LOGGER.warning("Unknown entity_id received: %s", entity_id)
+            return False
+        
+        # Skip unavailable/unknown/removed entities: their attributes would feed garbage into the PID
+        if new_state is None or new_state.state in _UNAVAILABLE_STATES:
+            if entity_id not in self._unavailable:
+                self._unavailable.add(entity_id)
+                _LOGGER.info("Entity %s is unavailable, keeping its last readings", entity_id)
+            return False
+        if entity_id in self._unavailable:
+            self._unavailable.discard(entity_id)
+            _LOGGER.info("Entity %s is available again", entity_id)
+        
         _LOGGER.debug("State change event received for entity_id=%s", entity_id)
         
         # Check if this is a climate entity update or TRV update
-        zone = self.zones.get(entity_id)
-        if zone and new_state:
+        zone = self._zone_get(entity_id)
+        if zone:
             # Climate entity update
-            zone.update_from_state(new_state)
-            _LOGGER.debug("Zone '%s' updated from state", zone.name)
+            significant = zone.update_from_state(new_state)
+            self._demand_index_by_zone[entity_id].update(zone)
+            _LOGGER.debug("Zone '%s' updated from state (significant=%s)", zone.name, significant)
+            return significant
+        
+        # TRV entity update (monitored, so it belongs to a zone)
+        trv_zone = self._trv_index[entity_id]
+        try:
+            # Extract TRV opening percentage from state
+            trv_opening = float(new_state.state)
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning(
+                "Error reading TRV opening from %s: %s",
+                entity_id, e
+            )
+            return False
+        
+        significant = trv_zone.update_trv_opening(trv_opening)
+        self._demand_index_by_zone[trv_zone.entity_id].update(trv_zone)
+        _LOGGER.debug(
+            "Zone '%s': TRV opening updated to %.0f%%",
+            trv_zone.name, trv_opening
+        )
+        return significant
+
+    def _recalculate(self) -> Optional[float]:
+        """
+        Recalculate the boiler command after a material zone change.
+        
+        Debounced mode only (re)arms the timer and returns None: the timer callback
+        dispatches the result once the zones are quiet. Immediate mode computes now
+        and returns the flow temperature for the caller to send.
+        """
+        if self._debounce_delay > 0:
+            self._schedule_recompute()
+            return None
+        return self._compute_flow_temp()
+
+    def _schedule_recompute(self) -> None:
+        """
+        Schedule a debounced boiler recalculation (trailing edge).
+        
+        Every event pushes the deadline back to debounce_delay from now, so a burst
+        of state changes results in a single recalculation. Only the
+        first event of a burst arms a timer; later events just move the deadline
+        instead of cancelling and re-creating a timer handle each time.
+        """
+        loop = self.hass.loop
+        self._debounce_deadline = loop.time() + self._debounce_delay
+        
+        if self._debounce_handle is None:
+            self._debounce_handle = loop.call_at(
+                self._debounce_deadline, self._run_debounced_recompute
+            )
         else:
-            # Check if this is a TRV entity update for any zone
-            trv_updated = False
-            for zone in self.zones.values():
-                if zone.trv_entity_id == entity_id and new_state:
-                    try:
-                        # Extract TRV opening percentage from state
-                        trv_opening = float(new_state.state)
-                        zone.update_trv_opening(trv_opening)
-                        trv_updated = True
-                        _LOGGER.debug(
-                            "Zone '%s': TRV opening updated to %.0f%%",
-                            zone.name, trv_opening
-                        )
-                    except (ValueError, TypeError) as e:
-                        _LOGGER.warning(
-                            "Error reading TRV opening from %s: %s",
-                            entity_id, e
-                        )
-                    break
-            
-            if not zone and not trv_updated:
-                _LOGGER.warning("Unknown entity_id received: %s", entity_id)
-            
-        # Recalculate boiler command based on all zones' current states
-        await self._calculate_and_command()
+            self._debounce_extended = True
+
+    def _run_debounced_recompute(self) -> None:
+        """Timer callback: run the recalculation once the zones have been quiet long enough."""
+        # Events arrived after the timer was armed: wait out the rest of the quiet period
+        if self._debounce_extended:
+            self._debounce_extended = False
+            self._debounce_handle = self.hass.loop.call_at(
+                self._debounce_deadline, self._run_debounced_recompute
+            )
+            return
+        
+        self._debounce_handle = None
+        self._dispatch_flow_temp(self._compute_flow_temp())
 
-    async def _calculate_and_command(self) -> None:
+    def _compute_flow_temp(self) -> float:
         """
         Core control algorithm: Find max demand zone with priority aggregation.
         
+        Zones are kept in per-priority max-demand indices that are re-keyed as
+        each zone changes, so no pass over the zones is needed here (the zones
+        are only walked for debug logging).
+        
         Algorithm:
-        1. Separate zones by priority level (high vs low priority)
-        2. For HIGH priority zones: any one can trigger boiler
-        3. For LOW priority zones: require at least 2 demanding to trigger boiler (prevent cycling)
-        4. Find zone with maximum demand among eligible zones
-        5. Use that zone's PID controller to calculate required boiler output
-        6. Map PID output to OpenTherm flow temperature
-        7. Command the boiler via Home Assistant service call
+        1. Read demanding-zone counts per priority level from the indices
+        2. For HIGH priority zones: best zone of the high index can trigger boiler
+        3. For LOW priority zones: best zone of the low index competes only if at
+           least 2 are demanding (prevent cycling); ties go to the high-priority zone
+        4. Use the winning zone's PID controller to calculate required boiler output
+        5. Map PID output to OpenTherm flow temperature (MIN_FLOW_TEMP = boiler OFF)
+        
+        Synchronous (no I/O), so event callbacks can run it inline; the caller sends
+        the returned flow temperature.
         
         Priority Aggregation:
         - High priority (priority > 0.5): Single zone can trigger boiler
@@ -220,129 +593,245 @@ class MasterController:
         - Error boosted when valve is closing (lower opening % = higher boost)
         - Compensates for TRV restricting flow as it approaches setpoint
         """
+        # One monotonic clock reading per recalculation (immune to NTP/DST wall-clock jumps)
+        now = monotonic()
         
-        # Step 1: Collect zones by priority level
-        high_priority_zones = []
-        low_priority_zones = []
+        # Step 1: Count demanding zones per priority level (maintained incrementally)
+        high_priority_count = self._high_priority_demand.demanding_count
+        low_priority_count = self._low_priority_demand.demanding_count
         
-        for zone in self.zones.values():
-            if zone.is_demanding_heat:
-                if zone.priority > 0.5:
-                    high_priority_zones.append(zone)
-                else:
-                    low_priority_zones.append(zone)
+        # All diagnostics below are skipped entirely unless debug logging is enabled
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         
-        # Log zone grouping for monitoring
-        _LOGGER.debug(
-            "Priority aggregation: %d high-priority demanding, %d low-priority demanding",
-            len(high_priority_zones), len(low_priority_zones)
-        )
-        
-        # Log detailed status of all zones
-        for zone in self.zones.values():
-            demand_metric = zone.get_demand_metric()
-            priority_group = "high" if zone.priority > 0.5 else "low"
+        if debug:
+            # Log zone grouping for monitoring
             _LOGGER.debug(
-                "Zone '%s': [%s-priority] demanding=%s, error=%.1f°C, priority=%.2f, demand_metric=%.2f°C%s",
-                zone.name, priority_group, zone.is_demanding_heat, zone.current_error, 
-                zone.priority, demand_metric,
-                f", TRV={zone.trv_opening_percent:.0f}%" if zone.trv_entity_id else ""
+                "Priority aggregation: %d high-priority demanding, %d low-priority demanding",
+                high_priority_count, low_priority_count
             )
-        
-        # Step 2: Determine if boiler should be activated
+            
+            # Log detailed status of all zones (O(N)), one priority group at a time
+            for group, zones in (("high", self._high_priority_zones), ("low", self._low_priority_zones)):
+                for zone in zones:
+                    status = (
+                        zone.name, group, zone.is_demanding_heat,
+                        zone.current_error, zone.priority, zone.demand_metric,
+                    )
+                    if zone.trv_entity_id:
+                        _LOGGER.debug(_ZONE_STATUS_TRV_LOG, *status, zone.trv_opening_percent)
+                    else:
+                        _LOGGER.debug(_ZONE_STATUS_LOG, *status)
+        
+        # Step 2 & 3: Find the zone with maximum demand among eligible zones
         # HIGH priority: any single zone demanding heat can trigger
         # LOW priority: require at least 2 zones demanding to prevent cycling
-        boiler_demand_eligible = []
-        
-        # Add all high-priority demanding zones
-        boiler_demand_eligible.extend(high_priority_zones)
+        max_demand_zone = None
+        max_demand = 0.0
         
-        # Add low-priority zones only if at least 2 are demanding
-        if len(low_priority_zones) >= 2:
-            boiler_demand_eligible.extend(low_priority_zones)
-            _LOGGER.debug(
-                "Low-priority aggregation: %d zones demanding, threshold met (≥2), including in boiler decision",
-                len(low_priority_zones)
-            )
-        elif len(low_priority_zones) == 1:
+        high_best = self._high_priority_demand.best()
+        if high_best:
+            max_demand_zone, max_demand = high_best
+        
+        # Include low-priority zones only if at least 2 are demanding
+        low_priority_triggered = False
+        if low_priority_count >= 2:
+            if debug:
+                _LOGGER.debug(
+                    "Low-priority aggregation: %d zones demanding, threshold met (≥2), including in boiler decision",
+                    low_priority_count
+                )
+            low_best = self._low_priority_demand.best()
+            if low_best and low_best[1] > max_demand:
+                max_demand_zone, max_demand = low_best
+                low_priority_triggered = True
+        elif low_priority_count == 1 and debug:
             _LOGGER.debug(
                 "Low-priority aggregation: %d zone demanding, threshold NOT met (<2), excluding from boiler decision",
-                len(low_priority_zones)
+                low_priority_count
             )
         
-        # Step 3: Find the zone with maximum demand among eligible zones
-        max_demand_zone = None
-        max_demand = 0.0
-        time_delta = 0.0
-        
-        for zone in boiler_demand_eligible:
-            demand_metric = zone.get_demand_metric()
-            if demand_metric > max_demand:
-                max_demand = demand_metric
-                max_demand_zone = zone
-                time_delta = time.time() - zone.last_update_time if zone.last_update_time else 0.0
-
         # Step 4: Command boiler based on max demand zone
         if max_demand_zone:
+            # Time since the winning zone's last update (only the winner's delta is needed)
+            last_update_time = max_demand_zone.last_update_time
+            time_delta = now - last_update_time if last_update_time else 0.0
+            
             # Calculate PID output from max demand zone's error
             pid_output = max_demand_zone.calculate_pid_output(time_delta)
             
             # Map PID output to physical flow temperature
-            # Formula: flow_temp = base_temp (40°C) + PID_boost
+            # Formula: flow_temp = BASE_FLOW_TEMP (40°C) + PID_boost
             # Higher error -> larger PID boost -> higher flow temperature
-            required_flow_temp = max(MIN_FLOW_TEMP, min(MAX_FLOW_TEMP, 40.0 + pid_output))
-            
-            await self.async_set_opentherm_flow_temp(required_flow_temp)
-            
-            # Determine boiler trigger reason (high-priority vs low-priority aggregation)
-            trigger_reason = "high-priority demand"
-            if max_demand_zone in low_priority_zones:
-                trigger_reason = f"low-priority aggregation ({len(low_priority_zones)} zones)"
+            # Clamped inline (no min()/max() builtin calls on the per-event path)
+            required_flow_temp = BASE_FLOW_TEMP + pid_output
+            if not MIN_FLOW_TEMP <= required_flow_temp <= MAX_FLOW_TEMP:
+                required_flow_temp = MAX_FLOW_TEMP if required_flow_temp > MAX_FLOW_TEMP else MIN_FLOW_TEMP
             
+            if _LOGGER.isEnabledFor(logging.INFO):
+                # Determine boiler trigger reason (high-priority vs low-priority aggregation)
+                trigger_reason = "high-priority demand"
+                if low_priority_triggered:
+                    trigger_reason = f"low-priority aggregation ({low_priority_count} zones)"
+                
+                _LOGGER.info(
+                    "Boiler ON [%s]. Max demand from zone '%s': error=%.1f°C, priority=%.2f, "
+                    "demand=%.2f°C, PID=%.2f, flow_temp=%.1f°C",
+                    trigger_reason, max_demand_zone.name, max_demand_zone.current_error, 
+                    max_demand_zone.priority, max_demand, pid_output, required_flow_temp
+                )
+            return required_flow_temp
+        
+        # No eligible zones demanding heat: turn boiler OFF
+        if low_priority_count > 0:
             _LOGGER.info(
-                "Boiler ON [%s]. Max demand from zone '%s': error=%.1f°C, priority=%.2f, "
-                "demand=%.2f°C, PID=%.2f, flow_temp=%.1f°C",
-                trigger_reason, max_demand_zone.name, max_demand_zone.current_error, 
-                max_demand_zone.priority, max_demand, pid_output, required_flow_temp
+                "Boiler OFF. No high-priority zones demanding. Low-priority zones: %d demanding (need ≥2)",
+                low_priority_count
             )
         else:
-            # No eligible zones demanding heat: turn boiler OFF
-            await self.async_set_opentherm_flow_temp(MIN_FLOW_TEMP)
-            
-            if len(low_priority_zones) > 0:
-                _LOGGER.info(
-                    "Boiler OFF. No high-priority zones demanding. Low-priority zones: %d demanding (need ≥2)",
-                    len(low_priority_zones)
-                )
-            else:
-                _LOGGER.info("Boiler OFF. All zones satisfied.")
+            _LOGGER.info("Boiler OFF. All zones satisfied.")
+        return MIN_FLOW_TEMP
+
+    def _dispatch_flow_temp(self, flow_temp: float) -> None:
+        """
+        Fire-and-forget: queue a flow temperature in the single-slot batcher.
+        
+        A newer value overwrites one that has not been written yet, and only one
+        flush task runs at a time, so there is at most one OpenTherm write in flight
+        and the boiler always ends up at the latest value. No task is created when
+        nothing is in flight and the boiler already has (nearly) this value.
+        """
+        if self._flush_task is None and self._flow_temp_is_current(_clamp_flow_temp(flow_temp), monotonic()):
+            return
+        self._pending_flow_temp = flow_temp
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_task(self._flush_flow_temp())
+
+    async def _flush_flow_temp(self) -> None:
+        """
+        Write queued flow temperatures until the batcher slot is empty.
+        
+        Nobody awaits this task, so a failed write is logged here instead of
+        escaping it, and values queued meanwhile are still written.
+        """
+        try:
+            while self._pending_flow_temp is not None:
+                flow_temp = self._pending_flow_temp
+                self._pending_flow_temp = None
+                try:
+                    await self.async_set_opentherm_flow_temp(flow_temp)
+                except Exception:
+                    _LOGGER.exception("Failed to set OpenTherm flow temperature to %.1f°C", flow_temp)
+        finally:
+            # A cancelled flush may finish after a newer one took the slot; leave that one in place
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+
+    def _flow_temp_is_current(self, final_temp: float, now: float) -> bool:
+        """True if the boiler was set within FLOW_TEMP_DEADBAND of final_temp less than FLOW_TEMP_REFRESH_INTERVAL ago."""
+        return (
+            self._last_flow_temp is not None
+            and abs(final_temp - self._last_flow_temp) < FLOW_TEMP_DEADBAND
+            and now - self._last_flow_temp_ts < FLOW_TEMP_REFRESH_INTERVAL
+        )
 
-    async def async_set_opentherm_flow_temp(self, flow_temp: float) -> None:
+    async def async_set_opentherm_flow_temp(self, flow_temp: float, force: bool = False) -> None:
         """
         Command the boiler's flow temperature via OpenTherm integration.
         
         Calls Home Assistant service to set the number entity that controls
         the ESPHome OpenTherm device. Includes safety clamping to min/max.
+        The call is skipped when the value is within FLOW_TEMP_DEADBAND of the
+        last commanded flow temperature, unless that command is older than
+        FLOW_TEMP_REFRESH_INTERVAL (periodic refresh).
         
         Args:
             flow_temp: Target flow temperature in °C (clamped to MIN_FLOW_TEMP .. MAX_FLOW_TEMP)
+            force: Send the command even if it matches the last one (bypasses the deadband)
         """
         
-        # Clamp to safe physical limits
-        final_temp = max(MIN_FLOW_TEMP, min(MAX_FLOW_TEMP, flow_temp))
+        # Clamp to safe physical limits (a NaN request falls back to MIN_FLOW_TEMP = boiler OFF)
+        final_temp = _clamp_flow_temp(flow_temp)
         
-        _LOGGER.debug(
-            "Setting OpenTherm flow temperature: requested=%.1f°C, final=%.1f°C",
-            flow_temp, final_temp
-        )
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        now = monotonic()
         
-        # Call Home Assistant number service to update the entity
-        await self.hass.services.async_call(
-            "number",
-            "set_value",
-            {"entity_id": OPEN_THERM_FLOW_TEMP_ENTITY, "value": final_temp},
-            blocking=False,
-        )
+        # Skip the service call if the boiler was recently set to (nearly) this flow temperature
+        if not force and self._flow_temp_is_current(final_temp, now):
+            if debug:
+                _LOGGER.debug(
+                    "OpenTherm flow temperature unchanged (%.1f°C), skipping service call",
+                    final_temp
+                )
+            return
+        
+        if debug:
+            _LOGGER.debug(
+                "Setting OpenTherm flow temperature: requested=%.1f°C, final=%.1f°C",
+                flow_temp, final_temp
+            )
+        # Remember the command before awaiting so overlapping recalculations dedupe against it
+        self._last_flow_temp = final_temp
+        self._last_flow_temp_ts = now
+        
+        # Call Home Assistant number service to update the entity. The service data is
+        # a fresh dict per call: HA keeps it in the EVENT_CALL_SERVICE event, which the
+        # recorder serializes later, so it must never be reused or mutated afterwards
+        try:
+            await self.hass.services.async_call(
+                "number",
+                "set_value",
+                {"entity_id": OPEN_THERM_FLOW_TEMP_ENTITY, "value": final_temp},
+                blocking=False,
+            )
+        except Exception:
+            # The boiler never received this value: forget it so the next recalculation resends
+            self._last_flow_temp = None
+            raise
+
+    def reset_pid_state(self) -> None:
+        """
+        Reset every zone's PID history (see ZoneWrapper.reset_pid_state).
+        
+        Zones, listeners and the last boiler command are kept, so this is a cheap
+        alternative to constructing a new controller to discard integral wind-up.
+        """
+        for zone in self.zones_list:
+            zone.reset_pid_state()
+
+    def reset(self) -> None:
+        """
+        Return the controller to its freshly constructed state without rebuilding it.
+        
+        Every zone is reset (see ZoneWrapper.reset), the demand indexes and the
+        unavailable set are emptied, a pending debounce or command flush is dropped
+        and the last boiler command is forgotten, so the next recalculation always
+        sends. Zones and the state change listener (if any) are kept.
+        
+        Only the test suites call this, to reuse one controller per test class
+        (see their _get_controller); Home Assistant builds a new controller for
+        every config entry instead.
+        """
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        self._debounce_deadline = 0.0
+        self._debounce_extended = False
+        
+        # The cancelled flush only clears the slot if it still owns it (see _flush_flow_temp),
+        # so a command dispatched right after the reset keeps its own flush task
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending_flow_temp = None
+        
+        self._last_flow_temp = None
+        self._last_flow_temp_ts = 0.0
+        self._unavailable.clear()
+        
+        for zone in self.zones_list:
+            zone.reset()
+        self._high_priority_demand.clear()
+        self._low_priority_demand.clear()
 
     def get_controller_state(self) -> dict:
         """
@@ -354,17 +843,18 @@ class MasterController:
         Returns:
             dict: Controller state with zones array containing PID data for each zone
         """
-        zones_state = []
-        for zone in self.zones.values():
-            zones_state.append({
+        zones_state = [
+            {
                 "name": zone.name,
                 "entity_id": zone.entity_id,
                 "state": zone.export_pid_state()
-            })
+            }
+            for zone in self.zones_list
+        ]
         
         return {
             "zones": zones_state,
-            "zone_count": len(self.zones)
+            "zone_count": len(self.zones_list)
         }
     
     def get_zone_state(self, entity_id: str) -> Optional[dict]:
@@ -8,11 +8,13 @@ Usage:
   python3 run_tests.py --test test_error_and_demand      # Run specific test
   python3 run_tests.py --module master --log-level INFO   # Run with specific log level
   python3 run_tests.py --output-dir ./custom_results     # Custom output directory
+  python3 run_tests.py --fast                             # Skip per-test log collection
 """
 
 import sys
 import argparse
 import logging
+import traceback
 from pathlib import Path
 from test_helpers import TestExecutor, setup_logging
 
@@ -42,6 +44,9 @@ EXAMPLES:
   Set logging level:
     python3 run_tests.py --log-level DEBUG
     python3 run_tests.py --log-level INFO
+
+  Skip collecting logs into the report (results only):
+    python3 run_tests.py --fast
         """
     )
     
@@ -80,6 +85,12 @@ EXAMPLES:
         help='Disable timestamp in output filename (default: timestamp enabled)'
     )
     
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Do not collect per-test logs into the report (default: logs included)'
+    )
+    
     parser.add_argument(
         '--list-modules',
         action='store_true',
@@ -116,12 +127,12 @@ EXAMPLES:
     try:
         exit_code = executor.run_tests(
             module_patterns=args.module,
-            test_names=args.test
+            test_names=args.test,
+            include_logs=not args.fast
         )
         return exit_code
     except Exception as e:
         print(f"Error running tests: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
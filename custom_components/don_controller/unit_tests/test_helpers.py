@@ -8,82 +8,201 @@ This module provides:
 - Common mock utilities
 """
 
+import asyncio
+import importlib
 import unittest
 import logging
 import json
 import sys
 import os
+import re
+import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Any, ClassVar, Dict, Iterable, List, Optional
 from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder is used without it
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup; the stdlib selector loop is used without it
+    uvloop = None
 
 # =========================================================
 # LOGGING INFRASTRUCTURE
 # =========================================================
 
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Compact JSON via orjson (non-ASCII text is written as UTF-8 rather than escaped)."""
+        return orjson.dumps(obj).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        """Compact JSON via the stdlib encoder."""
+        return json.dumps(obj, separators=(",", ":"))
+
+
+# Last whole second formatted by _format_timestamp and its "YYYY-MM-DDTHH:MM:SS" prefix
+_last_timestamp_second = -1
+_last_timestamp_prefix = ""
+
+
+def _format_timestamp(created: float) -> str:
+    """
+    ISO-8601 local timestamp with microseconds, without allocating a datetime.
+    
+    Records arrive in bursts within the same second, so the strftime prefix is
+    cached per whole second and only the fractional part is formatted per record.
+    """
+    global _last_timestamp_second, _last_timestamp_prefix
+    second = int(created)
+    if second != _last_timestamp_second:
+        _last_timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _last_timestamp_second = second
+    return _last_timestamp_prefix + ".%06d" % int((created - second) * 1e6)
+
+
+def _message(record: logging.LogRecord) -> str:
+    """record.getMessage(), returning a plain string message as-is when there are no args."""
+    msg = record.msg
+    if not record.args and type(msg) is str:
+        return msg
+    return record.getMessage()
+
+
+def _record_to_dict(record: logging.LogRecord) -> Dict[str, Any]:
+    """Convert a log record to the HA-compatible dict shared by the formatter and collector."""
+    return {
+        "timestamp": _format_timestamp(record.created),
+        "level": record.levelname,
+        "logger": record.name,
+        "message": _message(record),
+        "module": record.module,
+        "function": record.funcName,
+        "line": record.lineno,
+    }
+
+
 class HACompatibleFormatter(logging.Formatter):
     """Formatter compatible with Home Assistant logging format."""
     
+    # Same compact JSON as _dumps(_record_to_dict(record)); only the free-text
+    # fields (logger name, message) go through the JSON encoder
+    _TEMPLATE = (
+        '{"timestamp":"%s","level":"%s","logger":%s,"message":%s,'
+        '"module":"%s","function":"%s","line":%d}'
+    )
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record in HA-compatible JSON format."""
-        log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
-        return json.dumps(log_entry)
+        return self._TEMPLATE % (
+            _format_timestamp(record.created),
+            record.levelname,
+            _dumps(record.name),
+            _dumps(_message(record)),
+            record.module,
+            record.funcName,
+            record.lineno,
+        )
+
+
+class _CollectorHandler(logging.Handler):
+    """
+    Logging handler that appends raw records to a LogCollector's buffer.
+    
+    Records below min_level are rejected by the logger's handler level check,
+    before emit() is called or the message is formatted.
+    """
+    
+    def __init__(self, target: deque, min_level: int = logging.NOTSET):
+        super().__init__(min_level)
+        self._logs = target
+    
+    def handle(self, record: logging.LogRecord):
+        """Filter and store without taking the handler lock (deque.append is thread-safe)."""
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self._logs.append(record)
+        return rv
+    
+    def emit(self, record: logging.LogRecord):
+        self._logs.append(record)
 
 
 class LogCollector:
-    """Collects logs in memory for testing purposes."""
+    """
+    Collects logs in memory for testing purposes.
     
-    def __init__(self):
-        self.logs: List[Dict[str, Any]] = []
+    Raw log records are stored as emitted in a bounded buffer; messages are only
+    formatted and converted to dicts when the logs are queried.
+    """
+    
+    # Oldest records are dropped beyond this many, keeping memory flat in long scenarios
+    MAX_RECORDS = 100_000
+    
+    def __init__(self, max_records: Optional[int] = None):
+        """Create an empty collector keeping at most max_records records (default MAX_RECORDS)."""
+        self.logs: deque = deque(maxlen=max_records or self.MAX_RECORDS)
         self.handler: Optional[logging.Handler] = None
+        self.min_level: int = logging.NOTSET
+        # Logger the handler is attached to (looked up once, reused by stop_collecting)
+        self._logger: Optional[logging.Logger] = None
         
     def start_collecting(self, logger_name: str = "don_controller") -> None:
         """Start collecting logs from the specified logger."""
-        logger = logging.getLogger(logger_name)
-        
-        # Custom handler that appends to our logs list
-        class CollectorHandler(logging.Handler):
-            def __init__(self, collector: "LogCollector"):
-                super().__init__()
-                self.collector = collector
-                
-            def emit(self, record: logging.LogRecord):
-                log_entry = {
-                    "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                    "module": record.module,
-                    "function": record.funcName,
-                    "line": record.lineno,
-                }
-                self.collector.logs.append(log_entry)
-        
-        self.handler = CollectorHandler(self)
-        logger.addHandler(self.handler)
+        if self._logger is None or self._logger.name != logger_name:
+            self._logger = logging.getLogger(logger_name)
+        self.handler = _CollectorHandler(self.logs, self.min_level)
+        self._logger.addHandler(self.handler)
+    
+    def set_level(self, level: int) -> None:
+        """Only collect records at or above level (e.g. logging.WARNING); takes effect immediately."""
+        self.min_level = level
+        if self.handler:
+            self.handler.setLevel(level)
         
     def stop_collecting(self, logger_name: str = "don_controller") -> None:
         """Stop collecting logs."""
-        logger = logging.getLogger(logger_name)
         if self.handler:
+            logger = self._logger if self._logger is not None else logging.getLogger(logger_name)
             logger.removeHandler(self.handler)
             
     def get_logs(self) -> List[Dict[str, Any]]:
         """Get all collected logs."""
-        return self.logs
+        return [_record_to_dict(record) for record in self.logs]
+    
+    def filter_by_level(self, level: str) -> List[Dict[str, Any]]:
+        """Get collected logs of one level (e.g. "INFO"), compared by level number."""
+        level_no = logging.getLevelName(level)
+        return [_record_to_dict(record) for record in self.logs if record.levelno == level_no]
+    
+    def filter_by_message(self, substring: str) -> List[Dict[str, Any]]:
+        """Get collected logs whose message contains substring (case-insensitive)."""
+        needle = substring.lower()
+        return [_record_to_dict(record) for record in self.logs if needle in _message(record).lower()]
+    
+    def save_to_file(self, path: str) -> None:
+        """
+        Write collected logs as NDJSON (one compact JSON object per line).
+        
+        Records are converted and written one at a time, so no serialized copy
+        of the whole buffer is held in memory.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in self.logs:
+                f.write(_dumps(_record_to_dict(record)))
+                f.write("\n")
     
     def clear_logs(self) -> None:
         """Clear collected logs."""
-        self.logs = []
+        self.logs.clear()
 
 
 def setup_logging(level: int = logging.DEBUG) -> None:
@@ -106,70 +225,200 @@ def setup_logging(level: int = logging.DEBUG) -> None:
 # BASE TEST FIXTURE
 # =========================================================
 
+# Set HAS_TEST_DEBUG=1 to echo controller DEBUG logs to the console during tests
+DEBUG_LOGGING = bool(os.environ.get("HAS_TEST_DEBUG"))
+
+# Wall-clock reading every test starts from: 2023-01-01T00:00:00 UTC
+FIXED_TIME_START = 1672531200.0
+
+
+class FrozenClock:
+    """
+    Callable stand-in for time.time / monotonic returning a settable reading.
+    
+    Tests move time with `clock.return_value += seconds`, the same attribute a
+    patched Mock exposes, but each call is a plain attribute read with no
+    call recording.
+    """
+    
+    __slots__ = ("return_value",)
+    
+    def __init__(self, start: float) -> None:
+        self.return_value = start
+    
+    def __call__(self) -> float:
+        return self.return_value
+
+
 class UnifiedTestFixture(unittest.TestCase):
-    """Base class for all test suites with unified setup/teardown."""
+    """
+    Base class for all test suites with unified setup/teardown.
+    
+    Test methods stay synchronous and drive the controller's coroutines with
+    self._run / self._run_all on the class's shared event loop. Coroutine test
+    methods are not supported: IsolatedAsyncioTestCase would build a new loop
+    for every test, and running them on the shared loop would need a private
+    unittest hook.
+    """
+    
+    # Test classes that inspect collected logs opt in; all others skip the collector entirely
+    collect_logs: ClassVar[bool] = False
+    
+    # Modules whose monotonic clock is frozen for deterministic PID time deltas
+    # (patched per module: patching time.monotonic globally would freeze the asyncio loop)
+    CLOCK_PATCH_TARGETS = ('zone_wrapper.monotonic', 'master_controller.monotonic')
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one event loop shared by the class (asyncio.run builds a new loop per call)."""
+        super().setUpClass()
+        # uvloop when installed: cheaper task and handle scheduling for the many tiny coroutines
+        cls._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        # Also the thread's current loop, so helpers built outside a coroutine
+        # (futures, mocks awaiting on it) bind to the loop the tests run on
+        asyncio.set_event_loop(cls._loop)
+        
+        # Logging is configured once per class; setUp only empties the collector
+        if DEBUG_LOGGING:
+            setup_logging(level=logging.DEBUG)
+        cls._class_log_collector = None
+        if cls.collect_logs:
+            cls._class_log_collector = LogCollector()
+            cls._class_log_collector.start_collecting()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Detach the log collector, cancel tasks left behind by the tests, then close the shared event loop."""
+        if cls._class_log_collector:
+            cls._class_log_collector.stop_collecting()
+            cls._class_log_collector = None
+        loop = cls._loop
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        asyncio.set_event_loop(None)
+        loop.close()
+        super().tearDownClass()
+    
+    def _run(self, coro):
+        """Run a coroutine to completion on the class's shared event loop."""
+        return self._loop.run_until_complete(coro)
+    
+    def _run_all(self, coros):
+        """Run several coroutines concurrently in one pass of the shared loop; returns their results."""
+        return self._loop.run_until_complete(asyncio.gather(*coros))
     
     def setUp(self):
         """Set up test environment."""
-        self.time_patcher = patch('time.time', return_value=1672531200.0)  # 2023-01-01T00:00:00
-        self.mock_time = self.time_patcher.start()
+        # One clock shared by time.time and every patched monotonic, so tests advance
+        # all of them via self.mock_time.return_value; assigned directly (no mock.patch)
+        self.mock_time = FrozenClock(FIXED_TIME_START)
+        self._replaced_clocks = []
+        for target in ('time.time',) + self.CLOCK_PATCH_TARGETS:
+            module_name, attribute = target.rsplit('.', 1)
+            module = importlib.import_module(module_name)
+            self._replaced_clocks.append((module, attribute, getattr(module, attribute)))
+            setattr(module, attribute, self.mock_time)
         
         # Setup logging collection
-        setup_logging(level=logging.DEBUG)
-        self.log_collector = LogCollector()
-        self.log_collector.start_collecting()
+        logger = logging.getLogger("don_controller")
+        self._logger_level = logger.level
+        if DEBUG_LOGGING or self.collect_logs:
+            logger.setLevel(logging.DEBUG)
+        elif not logger.handlers:
+            # Nothing would see DEBUG records: the controller's isEnabledFor(DEBUG)
+            # guards then skip building diagnostics altogether
+            logger.setLevel(logging.WARNING)
+        # The class's collector, emptied so each test only sees its own records
+        self.log_collector: Optional[LogCollector] = self._class_log_collector
+        if self.log_collector:
+            self.log_collector.clear_logs()
 
     def tearDown(self):
         """Clean up test environment."""
-        self.time_patcher.stop()
-        self.log_collector.stop_collecting()
+        for module, attribute, original in reversed(self._replaced_clocks):
+            setattr(module, attribute, original)
+        logging.getLogger("don_controller").setLevel(self._logger_level)
     
     def assert_test_passes(self, description: str) -> bool:
-        """Helper to document test passing with specific coverage description."""
-        logs = self.log_collector.get_logs()
+        """Helper to document test passing with specific coverage description (requires collect_logs)."""
+        logs = self.get_logs()
         self.assertGreater(len(logs), 0, f"Test '{description}' has no log output")
         return True
     
+    @property
+    def _last_flow_temp(self) -> Optional[float]:
+        """Flow temperature of the latest boiler command (controller suites using a ServiceCallRecorder)."""
+        return self.mock_hass.services.async_call.last_flow_temp
+    
+    @property
+    def _commanded_flow_temps(self) -> List[float]:
+        """Flow temperature of every boiler command so far, oldest first (ServiceCallRecorder suites)."""
+        return [args[2]['value'] for args, _ in self.mock_hass.services.async_call.call_args_list]
+    
     def get_logs(self) -> List[Dict[str, Any]]:
-        """Get all collected logs for this test."""
-        return self.log_collector.get_logs()
+        """Get all collected logs for this test (empty unless collect_logs is set)."""
+        return self.log_collector.get_logs() if self.log_collector else []
 
 
 # =========================================================
 # TEST RESULT TRACKING
 # =========================================================
 
+# Report separators and fixed section headers (built once, newline-terminated)
+_BAR_EQ = "=" * 120 + "\n"
+_BAR_DASH = "-" * 120 + "\n"
+_REPORT_HEADER = _BAR_EQ + "COMPREHENSIVE UNIT TEST EXECUTION REPORT\n" + _BAR_EQ + "\n"
+_DETAILS_HEADER = _BAR_EQ + "DETAILED TEST RESULTS WITH LOGGING\n" + _BAR_EQ + "\n"
+_SUMMARY_HEADER = "\n" + _BAR_EQ + "EXECUTION SUMMARY\n" + _BAR_EQ + "\n"
+
+
 class DetailedTestResult(unittest.TextTestResult):
     """Custom test result class that captures detailed test information."""
     
-    def __init__(self, stream, descriptions, verbosity):
+    def __init__(self, stream, descriptions, verbosity, include_logs: bool = True):
         super().__init__(stream, descriptions, verbosity)
+        # Collect each test's logs only when they are written to the report
+        self.include_logs = include_logs
         self.test_details: List[Dict[str, Any]] = []
         self.current_log_collector: Optional[LogCollector] = None
+        # Formatted traceback per failed/errored test, keyed by id(test) (O(1) lookup in stopTest)
+        self._failure_traces: Dict[int, str] = {}
+    
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._failure_traces[id(test)] = self.failures[-1][1]
+    
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._failure_traces[id(test)] = self.errors[-1][1]
     
     def startTest(self, test):
         super().startTest(test)
-        self.current_test_start = datetime.now()
+        # Monotonic clock: cheap to read and unaffected by wall-clock changes
+        self.current_test_start = time.monotonic()
         # Create fresh log collector for each test
-        self.current_log_collector = LogCollector()
-        self.current_log_collector.start_collecting()
+        if self.include_logs:
+            self.current_log_collector = LogCollector()
+            self.current_log_collector.start_collecting()
     
     def stopTest(self, test):
         super().stopTest(test)
-        duration = (datetime.now() - self.current_test_start).total_seconds()
+        duration = time.monotonic() - self.current_test_start
         
-        # Get logs for this test
-        test_logs = self.current_log_collector.get_logs() if self.current_log_collector else []
-        self.current_log_collector.stop_collecting()
+        # Keep this test's raw log records; they are formatted while the report is written
+        test_logs = []
+        if self.current_log_collector:
+            test_logs = list(self.current_log_collector.logs)
+            self.current_log_collector.stop_collecting()
+            self.current_log_collector = None
         
         # Check if test passed
-        is_success = True
-        error_msg = None
-        for failure_test, trace in self.failures + self.errors:
-            if failure_test == test:
-                is_success = False
-                error_msg = trace
-                break
+        error_msg = self._failure_traces.get(id(test))
+        is_success = error_msg is None
         
         test_info = {
             'name': str(test),
@@ -185,12 +434,13 @@ class DetailedTestResult(unittest.TextTestResult):
 class DetailedTestRunner(unittest.TextTestRunner):
     """Custom test runner that logs to file with detailed information."""
     
-    def __init__(self, stream=None, descriptions=True, verbosity=2, log_file=None):
+    def __init__(self, stream=None, descriptions=True, verbosity=2, log_file=None, include_logs=True):
         self.log_file = log_file
+        self.include_logs = include_logs
         super().__init__(stream=stream, descriptions=descriptions, verbosity=verbosity)
     
     def _makeResult(self):
-        return DetailedTestResult(self.stream, self.descriptions, self.verbosity)
+        return DetailedTestResult(self.stream, self.descriptions, self.verbosity, self.include_logs)
     
     def run(self, test):
         result = super().run(test)
@@ -198,85 +448,85 @@ class DetailedTestRunner(unittest.TextTestRunner):
         return result
     
     def _write_detailed_report(self, result):
-        """Write detailed test report to file."""
+        """
+        Write detailed test report to file.
+        
+        The report is assembled as a list of strings and written with a single call.
+        """
         if not self.log_file:
             return
         
+        parts: List[str] = []
+        write = parts.append
+        
+        write(_REPORT_HEADER)
+        
+        write(f"Execution Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Total Tests: {result.testsRun}\n")
+        write(f"Passed: {result.testsRun - len(result.failures) - len(result.errors)}\n")
+        write(f"Failed: {len(result.failures)}\n")
+        write(f"Errors: {len(result.errors)}\n\n")
+        
+        write(_DETAILS_HEADER)
+        
+        for i, test_detail in enumerate(result.test_details, 1):
+            self._write_test_detail(write, i, test_detail)
+        
+        # Summary
+        write(_SUMMARY_HEADER)
+        
+        passed_tests = [t for t in result.test_details if t['result'] == 'PASS']
+        failed_tests = [t for t in result.test_details if t['result'] == 'FAIL']
+        
+        write(f"Total Executed: {len(result.test_details)}\n")
+        write(f"Passed: {len(passed_tests)} ({100*len(passed_tests)/len(result.test_details):.1f}%)\n")
+        write(f"Failed: {len(failed_tests)} ({100*len(failed_tests)/len(result.test_details):.1f}%)\n\n")
+        
+        if failed_tests:
+            write("FAILED TESTS:\n")
+            for test in failed_tests:
+                write(f"  - {test['name']}\n")
+        
         with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 120 + "\n")
-            f.write("COMPREHENSIVE UNIT TEST EXECUTION REPORT\n")
-            f.write("=" * 120 + "\n\n")
-            
-            f.write(f"Execution Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Tests: {result.testsRun}\n")
-            f.write(f"Passed: {result.testsRun - len(result.failures) - len(result.errors)}\n")
-            f.write(f"Failed: {len(result.failures)}\n")
-            f.write(f"Errors: {len(result.errors)}\n\n")
-            
-            f.write("=" * 120 + "\n")
-            f.write("DETAILED TEST RESULTS WITH LOGGING\n")
-            f.write("=" * 120 + "\n\n")
-            
-            for i, test_detail in enumerate(result.test_details, 1):
-                self._write_test_detail(f, i, test_detail)
-            
-            # Summary
-            f.write("\n" + "=" * 120 + "\n")
-            f.write("EXECUTION SUMMARY\n")
-            f.write("=" * 120 + "\n\n")
-            
-            passed_tests = [t for t in result.test_details if t['result'] == 'PASS']
-            failed_tests = [t for t in result.test_details if t['result'] == 'FAIL']
-            
-            f.write(f"Total Executed: {len(result.test_details)}\n")
-            f.write(f"Passed: {len(passed_tests)} ({100*len(passed_tests)/len(result.test_details):.1f}%)\n")
-            f.write(f"Failed: {len(failed_tests)} ({100*len(failed_tests)/len(result.test_details):.1f}%)\n\n")
-            
-            if failed_tests:
-                f.write("FAILED TESTS:\n")
-                for test in failed_tests:
-                    f.write(f"  - {test['name']}\n")
+            f.write("".join(parts))
     
-    def _write_test_detail(self, f, test_num, test_detail):
-        """Write detailed information for a single test."""
-        f.write(f"\n{'='*120}\n")
-        f.write(f"[TEST {test_num}] {test_detail['name']}\n")
-        f.write(f"{'='*120}\n\n")
+    def _write_test_detail(self, write, test_num, test_detail):
+        """Write detailed information for a single test through write (appends to the report)."""
+        write("\n" + _BAR_EQ)
+        write(f"[TEST {test_num}] {test_detail['name']}\n")
+        write(_BAR_EQ + "\n")
         
         # Test description (docstring)
         if test_detail['docstring']:
-            f.write("TEST PURPOSE & COVERAGE:\n")
-            f.write("-" * 120 + "\n")
-            f.write(test_detail['docstring'].strip())
-            f.write("\n\n")
+            write("TEST PURPOSE & COVERAGE:\n")
+            write(_BAR_DASH)
+            write(test_detail['docstring'].strip())
+            write("\n\n")
         
         # Test result
-        f.write(f"RESULT: {test_detail['result']} (Duration: {test_detail['duration']:.4f}s)\n\n")
+        write(f"RESULT: {test_detail['result']} (Duration: {test_detail['duration']:.4f}s)\n\n")
         
         # Log output
         if test_detail['logs']:
-            f.write("DETAILED LOGGING OUTPUT (Showing How Test Validates Coverage):\n")
-            f.write("-" * 120 + "\n")
-            for i, log_entry in enumerate(test_detail['logs'], 1):
-                timestamp = log_entry.get('timestamp', 'unknown')
-                level = log_entry.get('level', 'INFO')
-                message = log_entry.get('message', '')
-                module = log_entry.get('module', '')
-                func = log_entry.get('function', '')
-                line = log_entry.get('line', 0)
-                
-                f.write(f"  [{i}] {timestamp} | {level:8} | {module}.{func}:{line}\n")
-                f.write(f"      └─ {message}\n\n")
-            f.write("-" * 120 + "\n\n")
+            write("DETAILED LOGGING OUTPUT (Showing How Test Validates Coverage):\n")
+            write(_BAR_DASH)
+            # Raw records have a fixed shape: read their attributes directly, no intermediate dict
+            for i, record in enumerate(test_detail['logs'], 1):
+                write(
+                    f"  [{i}] {_format_timestamp(record.created)} | {record.levelname:8} | "
+                    f"{record.module}.{record.funcName}:{record.lineno}\n"
+                    f"      └─ {_message(record)}\n\n"
+                )
+            write(_BAR_DASH + "\n")
         else:
-            f.write("(No logging output captured - test passed with assertions only)\n\n")
+            write("(No logging output captured - test passed with assertions only)\n\n")
         
         # Error details if failed
         if test_detail['result'] == 'FAIL' and test_detail['error_msg']:
-            f.write("ERROR DETAILS:\n")
-            f.write("-" * 120 + "\n")
-            f.write(test_detail['error_msg'])
-            f.write("\n" + "-" * 120 + "\n\n")
+            write("ERROR DETAILS:\n")
+            write(_BAR_DASH)
+            write(test_detail['error_msg'])
+            write("\n" + _BAR_DASH + "\n")
 
 
 # =========================================================
@@ -289,23 +539,32 @@ class TestExecutor:
     def __init__(self, test_dir: str = "."):
         self.test_dir = test_dir
         self.test_modules: List[str] = []
+        # Discovered module names (None = directory not read yet)
+        self._modules_cache: Optional[List[str]] = None
         self.results_dir = Path(test_dir) / "test_results"
         self.results_dir.mkdir(exist_ok=True)
     
     def discover_test_modules(self) -> List[str]:
-        """Discover all test modules (test_*.py files)."""
-        test_files = sorted(Path(self.test_dir).glob("test_*.py"))
-        self.test_modules = [f.stem for f in test_files if f.stem != "test_helpers"]
+        """Discover all test modules (test_*.py files); the directory is read only once."""
+        if self._modules_cache is None:
+            with os.scandir(self.test_dir) as entries:
+                self._modules_cache = sorted(
+                    entry.name[:-3] for entry in entries
+                    if entry.name.startswith("test_") and entry.name.endswith(".py")
+                    and entry.name != "test_helpers.py" and entry.is_file()
+                )
+        self.test_modules = self._modules_cache
         return self.test_modules
     
     def run_tests(self, module_patterns: Optional[List[str]] = None, 
-                  test_names: Optional[List[str]] = None) -> int:
+                  test_names: Optional[List[str]] = None, include_logs: bool = True) -> int:
         """
         Run tests with optional filtering.
         
         Args:
             module_patterns: List of module name patterns to run (e.g., ['zone', 'master'])
             test_names: List of specific test names to run (e.g., ['test_error_and_demand_calculation'])
+            include_logs: Collect each test's logs into the report (False = results only, faster)
         
         Returns:
             0 if all tests pass, 1 otherwise
@@ -313,16 +572,21 @@ class TestExecutor:
         # Discover available modules
         available_modules = self.discover_test_modules()
         
-        # Filter modules if patterns provided
+        # Filter modules if patterns provided (case-insensitive substring match, discovery order)
         if module_patterns:
-            modules_to_run = []
-            for pattern in module_patterns:
-                matching = [m for m in available_modules if pattern.lower() in m.lower()]
-                modules_to_run.extend(matching)
-            modules_to_run = list(set(modules_to_run))  # Remove duplicates
+            # dict.fromkeys: drop repeated patterns while keeping their order
+            module_filter = re.compile(
+                "|".join(re.escape(p) for p in dict.fromkeys(module_patterns)), re.IGNORECASE
+            )
+            modules_to_run = [m for m in available_modules if module_filter.search(m)]
         else:
             modules_to_run = available_modules
         
+        # Test name filter: any of the given substrings (case-sensitive), compiled once
+        name_filter = (
+            re.compile("|".join(re.escape(n) for n in dict.fromkeys(test_names))) if test_names else None
+        )
+        
         # Load tests
         loader = unittest.TestLoader()
         suite = unittest.TestSuite()
@@ -333,12 +597,11 @@ class TestExecutor:
                 module_suite = loader.loadTestsFromModule(module)
                 
                 # Filter by test names if provided
-                if test_names:
+                if name_filter:
                     filtered_suite = unittest.TestSuite()
                     for test_group in module_suite:
                         for test in test_group:
-                            test_method = test._testMethodName
-                            if any(name in test_method for name in test_names):
+                            if name_filter.search(test._testMethodName):
                                 filtered_suite.addTest(test)
                     suite.addTests(filtered_suite)
                 else:
@@ -354,7 +617,8 @@ class TestExecutor:
         runner = DetailedTestRunner(
             verbosity=2,
             log_file=str(output_file),
-            stream=sys.stdout
+            stream=sys.stdout,
+            include_logs=include_logs
         )
         
         print(f"\n{'='*120}")
@@ -388,6 +652,9 @@ class TestExecutor:
 class MockState:
     """Mock Home Assistant state object."""
     
+    # Created several times per test event: fixed slots, no per-instance __dict__
+    __slots__ = ("entity_id", "attributes", "state")
+    
     def __init__(self, entity_id: str, attributes: Optional[Dict[str, Any]] = None):
         self.entity_id = entity_id
         self.attributes = attributes or {}
@@ -403,32 +670,151 @@ class MockState:
         return f"<MockState entity_id='{self.entity_id}' attrs={self.attributes}>"
 
 
+# Resolved future returned by the service call stubs, cached for the loop it belongs to
+_done_future_cache: Optional[asyncio.Future] = None
+
+
+def _done_future() -> asyncio.Future:
+    """
+    Already-resolved future of the running loop.
+    
+    Awaiting a done future returns at once without suspending, so the stubs can
+    hand out this shared object instead of allocating a coroutine per call.
+    """
+    global _done_future_cache
+    future = _done_future_cache
+    loop = asyncio.get_running_loop()
+    if future is None or future.get_loop() is not loop:
+        future = _done_future_cache = loop.create_future()
+        future.set_result(None)
+    return future
+
+
+class ServiceCallRecorder:
+    """
+    Cheap awaitable stand-in for an AsyncMock service call.
+    
+    Records each call as an (args, kwargs) pair and supports the subset of the
+    mock API the suites use (call_args, call_args_list, call_count, reset_mock
+    and the assert_* helpers), without building a mock spec tree per call.
+    The 'value' of the latest service data is also kept in last_flow_temp.
+    
+    side_effect takes one outcome per call, like AsyncMock: an exception
+    instance is raised (the call is still recorded), None succeeds. Calls past
+    the end of the sequence succeed.
+    """
+    
+    __slots__ = ("call_args_list", "last_flow_temp", "_side_effect")
+    
+    def __init__(self, side_effect: Optional[Iterable[Optional[BaseException]]] = None):
+        self.call_args_list: List[tuple] = []
+        self.last_flow_temp: Optional[float] = None
+        self._side_effect = iter(side_effect) if side_effect is not None else None
+    
+    def __call__(self, *args, **kwargs) -> asyncio.Future:
+        self.call_args_list.append((args, kwargs))
+        if len(args) > 2 and args[2]:
+            self.last_flow_temp = args[2].get('value')
+        if self._side_effect is not None:
+            error = next(self._side_effect, None)
+            if error is not None:
+                raise error
+        return _done_future()
+    
+    @property
+    def call_args(self) -> Optional[tuple]:
+        """(args, kwargs) of the most recent call, or None if never called."""
+        return self.call_args_list[-1] if self.call_args_list else None
+    
+    @property
+    def call_count(self) -> int:
+        return len(self.call_args_list)
+    
+    def reset_mock(self) -> None:
+        self.call_args_list.clear()
+        self.last_flow_temp = None
+    
+    def assert_not_called(self) -> None:
+        if self.call_args_list:
+            raise AssertionError(f"Expected no service call, got {self.call_args_list}")
+    
+    def assert_called_once(self) -> None:
+        if len(self.call_args_list) != 1:
+            raise AssertionError(f"Expected one service call, got {len(self.call_args_list)}")
+    
+    def assert_called_once_with(self, *args, **kwargs) -> None:
+        self.assert_called_once()
+        if self.call_args_list[0] != (args, kwargs):
+            raise AssertionError(f"Expected call {(args, kwargs)}, got {self.call_args_list[0]}")
+
+
+class RecordingServices:
+    """
+    Lightweight stand-in for hass.services.
+    
+    Records every service call in a plain list instead of a MagicMock, which
+    synthesizes child mocks on attribute access and is slow in long event loops.
+    Tests that need mock assertions replace async_call with a ServiceCallRecorder.
+    """
+    
+    # async_call is listed so tests can replace it per instance
+    __slots__ = ("calls", "async_call")
+    
+    def __init__(self):
+        self.async_call = self._record
+        self.calls: List[tuple] = []
+    
+    def _record(self, domain, service, service_data=None, blocking=False, **kwargs) -> asyncio.Future:
+        """Record the call as (domain, service, service_data, blocking); returns an awaitable."""
+        self.calls.append((domain, service, service_data, blocking))
+        return _done_future()
+
+
 class MockHASS:
     """Mock Home Assistant Core object for service calls."""
     
+    # The controller only touches services, loop and async_create_task; the latter
+    # two are left unset until a test that schedules work assigns them
+    __slots__ = ("services", "loop", "async_create_task")
+    
     def __init__(self):
-        from unittest.mock import MagicMock
-        # Mock the service call interface
-        self.services = MagicMock()
-        # Mock the event tracking setup
-        self.helpers = MagicMock()
+        # Service call interface (event tracking is imported directly by the controller)
+        self.services = RecordingServices()
 
     async def async_call(self, domain, service, service_data, blocking):
         """Stub for hass.services.async_call, records the call."""
-        from unittest.mock import MagicMock
-        return self.services.async_call(domain, service, service_data, blocking)
+        return await self.services.async_call(domain, service, service_data, blocking)
+
+
+def freeze_configs(configs) -> tuple:
+    """Read-only zone configurations for class-level fixtures (built once, never mutated by tests)."""
+    return tuple(MappingProxyType(dict(config)) for config in configs)
+
 
+class MockEvent:
+    """Mock Home Assistant state change event (only the data payload is used)."""
+    
+    __slots__ = ("data",)
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+    
+    def __repr__(self):
+        return f"<MockEvent data={self.data}>"
 
-def create_mock_event(entity_id: str, current_temp: float, target_temp: float, hvac_action: str):
-    """Helper to create a mock event dictionary for controller input."""
-    from unittest.mock import MagicMock
+
+def create_mock_event(entity_id: str, current_temp: float, target_temp: float, hvac_action: str) -> MockEvent:
+    """
+    Helper to create a mock event dictionary for controller input.
+    
+    Built from the slotted MockState/MockEvent (no Mock objects). Each call returns
+    fresh objects rather than a cached instance, since tests edit event.data and
+    state attributes in place.
+    """
     state = MockState(entity_id, attributes={
         'current_temperature': current_temp,
         'temperature': target_temp,
         'hvac_action': hvac_action
     })
-    return MagicMock(data={'entity_id': entity_id, 'new_state': state})
-
+    return MockEvent(data={'entity_id': entity_id, 'new_state': state})
 
-# Fixed time reference for consistent test behavior
-FIXED_TIME_START = 1672531200.0  # 2023-01-01T00:00:00 UTC
@@ -1,14 +1,13 @@
 import unittest
-import asyncio
-from unittest.mock import AsyncMock
 import sys
 import os
+from typing import ClassVar
 
 # --- PATH ADJUSTMENT ---
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # --- Import from unified test helpers ---
-from test_helpers import UnifiedTestFixture, MockHASS, create_mock_event
+from test_helpers import UnifiedTestFixture, MockHASS, ServiceCallRecorder, create_mock_event, freeze_configs
 from zone_wrapper import KP
 from master_controller import MasterController, MIN_FLOW_TEMP, MAX_FLOW_TEMP, OPEN_THERM_FLOW_TEMP_ENTITY
 
@@ -20,13 +19,30 @@ from master_controller import MasterController, MIN_FLOW_TEMP, MAX_FLOW_TEMP, OP
 class BaseTestFixture(UnifiedTestFixture):
     """Extended base class with master controller-specific setup."""
     
+    ZONE_CONFIGS: ClassVar[tuple] = freeze_configs([
+        {"entity_id": "climate.test_bedroom", "name": "Bedroom", "area": 10.0},
+        {"entity_id": "climate.test_kitchen", "name": "Kitchen", "area": 15.0},
+    ])
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One controller per test class, built on first use and reset for each test
+        cls._cached_controller = None
+    
+    def _get_controller(self) -> MasterController:
+        """Return the class's shared controller, reset and bound to this test's mock HASS."""
+        controller = type(self)._cached_controller
+        if controller is None:
+            controller = type(self)._cached_controller = MasterController(self.mock_hass, self.zone_configs)
+        controller.hass = self.mock_hass
+        controller.reset()
+        return controller
+    
     def setUp(self):
         super().setUp()
         
-        self.zone_configs = [
-            {"entity_id": "climate.test_bedroom", "name": "Bedroom", "area": 10.0},
-            {"entity_id": "climate.test_kitchen", "name": "Kitchen", "area": 15.0},
-        ]
+        self.zone_configs = self.ZONE_CONFIGS
         self.mock_hass = MockHASS()
 
 # =========================================================
@@ -38,13 +54,13 @@ class TestMasterController(BaseTestFixture):
     def test_controller_no_demand_commands_off(self):
         """Test the MasterController commands boiler OFF (MIN_FLOW_TEMP) when no zone demands heat."""
         
-        self.mock_hass.services.async_call = AsyncMock() 
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder() 
+        controller = self._get_controller()
         
         # Create an event where the zone is satisfied
         mock_event = create_mock_event("climate.test_bedroom", 21.0, 20.0, 'idle')
 
-        asyncio.run(controller._async_hvac_demand_change(mock_event))
+        self._run(controller._async_hvac_demand_change(mock_event))
         
         # Assert the service call was made with the minimum flow temperature
         self.mock_hass.services.async_call.assert_called_once_with(
@@ -56,23 +72,22 @@ class TestMasterController(BaseTestFixture):
     def test_controller_selects_max_demand_zone(self):
         """Test the MasterController selects the zone with the largest positive error."""
         
-        self.mock_hass.services.async_call = AsyncMock() 
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder() 
+        controller = self._get_controller()
         
         # 1. Simulate Kitchen demand (Error 3.0)
         kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 20.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         # 2. Simulate Bedroom demand (Error 1.0 - lower demand, but triggers recalculation)
         bedroom_event = create_mock_event("climate.test_bedroom", 19.0, 20.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
         # The commanded flow temp must be based on the Kitchen's 3.0 error.
         # P-component contribution: 3.0 * KP (0.5) = 1.5. 
         # Commanded Temp is roughly 40.0 + 1.5 = 41.5
         
-        args, kwargs = self.mock_hass.services.async_call.call_args
-        commanded_flow_temp = args[2]['value']
+        commanded_flow_temp = self._last_flow_temp
         
         expected_min_temp = 40.0 + (3.0 * KP) 
         
@@ -82,22 +97,40 @@ class TestMasterController(BaseTestFixture):
     def test_controller_commands_max_flow_temp_when_needed(self):
         """Test that the commanded flow temp does not exceed the defined maximum."""
         
-        self.mock_hass.services.async_call = AsyncMock() 
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder() 
+        controller = self._get_controller()
         
         # Create an event with an enormous error (Error 80.0) to force maximum PID output
         # P = 80 * 0.5 = 40, so flow_temp = 40 + 40 = 80 (which equals MAX_FLOW_TEMP)
         mock_event = create_mock_event("climate.test_bedroom", 10.0, 90.0, 'heating')
 
-        asyncio.run(controller._async_hvac_demand_change(mock_event))
+        self._run(controller._async_hvac_demand_change(mock_event))
         
-        args, kwargs = self.mock_hass.services.async_call.call_args
-        commanded_flow_temp = args[2]['value']
+        commanded_flow_temp = self._last_flow_temp
         
         # The commanded value should be capped at MAX_FLOW_TEMP (80.0)
         self.assertEqual(commanded_flow_temp, MAX_FLOW_TEMP, 
                          "Commanded flow temperature must not exceed MAX_FLOW_TEMP.")
 
+    def test_integral_frozen_while_flow_temp_saturated(self):
+        """Test that the integral does not grow while the flow temp is held at MAX_FLOW_TEMP."""
+
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
+        bedroom = controller.zones["climate.test_bedroom"]
+
+        # P alone already reaches MAX_FLOW_TEMP, so every further step is saturated
+        mock_event = create_mock_event("climate.test_bedroom", 10.0, 90.0, 'heating')
+        self._run(controller._async_hvac_demand_change(mock_event))
+        integral_at_saturation = bedroom.pid_integral_sum
+
+        for _ in range(5):
+            self.mock_time.return_value += 600
+            self._run(controller._async_hvac_demand_change(mock_event))
+            self.assertEqual(self._last_flow_temp, MAX_FLOW_TEMP)
+            self.assertLessEqual(bedroom.pid_integral_sum, integral_at_saturation,
+                                 "Integral must not wind up while the output is saturated")
+
 
 # =========================================================
 # SUNNY DAY SCENARIO TESTS
@@ -108,29 +141,27 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
     
     def test_sunny_day_solar_gain_reduces_boiler_demand(self):
         """Test that boiler output reduces as solar gain increases room temperature."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Morning: High demand due to cold
         morning_event = create_mock_event("climate.test_bedroom", 16.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(morning_event))
+        self._run(controller._async_hvac_demand_change(morning_event))
         
-        morning_args = self.mock_hass.services.async_call.call_args[0]
-        morning_flow_temp = morning_args[2]['value']
+        morning_flow_temp = self._last_flow_temp
         
         # Afternoon: Solar gain warms room. Integral has accumulated though.
         # To properly test solar gain reduction, reset the controller
         self.mock_hass.services.async_call.reset_mock()
         self.mock_time.return_value += 3600
         
-        # Create fresh controller (simulating afternoon reset)
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        # Reset the PID history (simulating afternoon reset)
+        controller.reset_pid_state()
         
         afternoon_event = create_mock_event("climate.test_bedroom", 19.5, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(afternoon_event))
+        self._run(controller._async_hvac_demand_change(afternoon_event))
         
-        afternoon_args = self.mock_hass.services.async_call.call_args[0]
-        afternoon_flow_temp = afternoon_args[2]['value']
+        afternoon_flow_temp = self._last_flow_temp
         
         # Boiler should command lower flow temperature (based on smaller error 1.5 vs 5.0)
         self.assertGreater(morning_flow_temp, afternoon_flow_temp)
@@ -138,24 +169,23 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
     
     def test_sunny_day_zone_priority_shift(self):
         """Test that max demand zone selection changes as conditions change."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Morning: Bedroom has more demand (colder)
         bedroom_event = create_mock_event("climate.test_bedroom", 16.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
         # Warm up bedroom
         self.mock_time.return_value += 900  # 15 min
         bedroom_event = create_mock_event("climate.test_bedroom", 20.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
         # Now kitchen becomes max demand
         kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
-        args = self.mock_hass.services.async_call.call_args[0]
-        final_temp = args[2]['value']
+        final_temp = self._last_flow_temp
         
         # Should be based on kitchen's larger error
         expected_kitchen_temp = 40.0 + (4.0 * KP)  # kitchen error 4.0
@@ -163,25 +193,24 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
     
     def test_sunny_day_gradual_demand_decrease(self):
         """Test gradual decrease in boiler demand as temperatures rise."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         flow_temps = []
         
-        # Simulate 4 hourly updates with gradual temperature increase (fresh controller)
+        # Simulate 4 hourly updates with gradual temperature increase (PID reset each hour)
         current_temps = [16.0, 17.5, 19.0, 20.5]
         
         for i, current_temp in enumerate(current_temps):
             # Reset controller and mock to avoid integral accumulation across hours
             if i > 0:
-                controller = MasterController(self.mock_hass, self.zone_configs)
+                controller.reset_pid_state()
                 self.mock_hass.services.async_call.reset_mock()
             
             event = create_mock_event("climate.test_bedroom", current_temp, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
             
-            args = self.mock_hass.services.async_call.call_args[0]
-            flow_temps.append(args[2]['value'])
+            flow_temps.append(self._last_flow_temp)
             
             self.mock_time.return_value += 3600
         
@@ -198,18 +227,17 @@ class TestMasterControllerRainyDay(BaseTestFixture):
     
     def test_rainy_day_sustained_heating(self):
         """Test sustained boiler operation on rainy day."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         flow_temps = []
         
         # Simulate rainy day: consistent demand over several updates
         for hour in range(4):
             event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
             
-            args = self.mock_hass.services.async_call.call_args[0]
-            flow_temp = args[2]['value']
+            flow_temp = self._last_flow_temp
             flow_temps.append(flow_temp)
             
             self.mock_time.return_value += 3600
@@ -220,46 +248,46 @@ class TestMasterControllerRainyDay(BaseTestFixture):
     
     def test_rainy_day_multi_zone_equal_demand(self):
         """Test load balancing when multiple zones have equal demand on rainy day."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Both zones equally cold
         bedroom_event = create_mock_event("climate.test_bedroom", 17.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
-        first_call_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        first_call_temp = self._last_flow_temp
         
         # Kitchen at same demand
         kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
-        second_call_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        second_call_temp = self._last_flow_temp
         
         # Should command same flow temp for equal errors
         self.assertAlmostEqual(first_call_temp, second_call_temp, delta=0.5)
     
     def test_rainy_day_one_zone_satisfies_early(self):
         """Test behavior when one zone satisfies before others on rainy day."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Both zones initially cold
         bedroom_event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
         kitchen_event = create_mock_event("climate.test_kitchen", 18.0, 21.0, 'heating')
         
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
-        first_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        self._run(controller._async_hvac_demand_change(bedroom_event))
+        first_temp = self._last_flow_temp
         
         # Bedroom reaches target
         self.mock_time.return_value += 1800
         bedroom_satisfied = create_mock_event("climate.test_bedroom", 21.0, 21.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_satisfied))
+        self._run(controller._async_hvac_demand_change(bedroom_satisfied))
         
         # Kitchen still needs heating
         kitchen_event = create_mock_event("climate.test_kitchen", 18.5, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
-        second_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        second_temp = self._last_flow_temp
         
         # Should now base command on kitchen's error (2.5)
         self.assertGreater(second_temp, MIN_FLOW_TEMP)
@@ -267,42 +295,43 @@ class TestMasterControllerRainyDay(BaseTestFixture):
     
     def test_rainy_day_slow_temperature_rise(self):
         """Test behavior with slow, steady temperature increase on rainy day."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start with large error
         event = create_mock_event("climate.test_bedroom", 16.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(event))
+        self._run(controller._async_hvac_demand_change(event))
         
-        initial_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        initial_temp = self._last_flow_temp
         
         # Small temperature increases every 10 minutes (rainy day, minimal solar gain)
-        # Create fresh controller for each update to avoid integral wind-up
+        # Clear the bedroom's PID history before each update so only P changes (no integral)
+        bedroom = controller.zones["climate.test_bedroom"]
         for i in range(5):
-            controller = MasterController(self.mock_hass, self.zone_configs)
+            bedroom.reset_pid_state()
             self.mock_hass.services.async_call.reset_mock()
             
             self.mock_time.return_value += 600  # 10 minutes
             current = 16.0 + (i * 0.2)  # Slow increase
             event = create_mock_event("climate.test_bedroom", current, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
-        final_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        final_temp = self._last_flow_temp
         
         # Command should decrease as error decreases (5.0 -> 4.2)
-        # With fresh controllers: P_initial = 5.0 * 0.5 = 2.5, temp = 42.5
+        # With the PID history cleared: P_initial = 5.0 * 0.5 = 2.5, temp = 42.5
         # P_final = 4.2 * 0.5 = 2.1, temp = 42.1
         # Should be less than initial
         self.assertLess(final_temp, initial_temp)
     
     def test_rainy_day_integral_effect_over_time(self):
         """Test integral term accumulation effect on rainy day."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start with persistent 2°C error
         event1 = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(event1))
+        self._run(controller._async_hvac_demand_change(event1))
         
         # Get the zone to check integral state
         zone = controller.zones["climate.test_bedroom"]
@@ -311,7 +340,7 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         for hour in range(2):
             self.mock_time.return_value += 3600
             event = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
         # Integral should have accumulated
         self.assertGreater(zone.pid_integral_sum, 0)
@@ -326,44 +355,44 @@ class TestMasterControllerTransitions(BaseTestFixture):
     
     def test_sunny_to_rainy_transition(self):
         """Test system response when sunny day turns rainy."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Sunny afternoon: room warmed by solar gain
         sunny_event = create_mock_event("climate.test_bedroom", 20.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(sunny_event))
-        sunny_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        self._run(controller._async_hvac_demand_change(sunny_event))
+        sunny_temp = self._last_flow_temp
         
         # Sun sets, clouds move in: temperature starts dropping
         self.mock_time.return_value += 7200  # 2 hours
         rainy_event = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(rainy_event))
-        rainy_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        self._run(controller._async_hvac_demand_change(rainy_event))
+        rainy_temp = self._last_flow_temp
         
         # Boiler should increase demand
         self.assertLess(sunny_temp, rainy_temp)
     
     def test_all_zones_satisfied_to_demanding(self):
         """Test boiler behavior when demand appears after all zones satisfied."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # All zones satisfied
         bedroom_event = create_mock_event("climate.test_bedroom", 21.0, 21.0, 'idle')
         kitchen_event = create_mock_event("climate.test_kitchen", 21.0, 21.0, 'idle')
         
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
-        off_call = self.mock_hass.services.async_call.call_args[0][2]['value']
+        off_call = self._last_flow_temp
         self.assertEqual(off_call, MIN_FLOW_TEMP)
         
         # Sudden demand (door opens, cold air)
         self.mock_time.return_value += 1800
         demand_event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(demand_event))
+        self._run(controller._async_hvac_demand_change(demand_event))
         
-        on_call = self.mock_hass.services.async_call.call_args[0][2]['value']
+        on_call = self._last_flow_temp
         self.assertGreater(on_call, MIN_FLOW_TEMP + 5)
 
 
@@ -388,38 +417,39 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
     - Study -> influences Living Room, Hallway
     - Bathroom -> influences Master Suite
     - Hallway (main thermal hub) -> influences all zones
+    
+    Tests share only the class's controller, reset at the start of each test, so
+    the class can run in its own process alongside the other classes.
     """
     
-    def setUp(self):
-        super().setUp()
-        # 11-room configuration with realistic thermal properties
-        self.zone_configs = [
-            {"entity_id": "climate.master_suite", "name": "Master Suite", "area": 20.0},
-            {"entity_id": "climate.bedroom2", "name": "Bedroom 2", "area": 15.0},
-            {"entity_id": "climate.bathroom", "name": "Bathroom", "area": 8.0},
-            {"entity_id": "climate.living_room", "name": "Living Room", "area": 30.0},
-            {"entity_id": "climate.kitchen", "name": "Kitchen", "area": 18.0},
-            {"entity_id": "climate.hallway", "name": "Hallway", "area": 12.0},
-            {"entity_id": "climate.study", "name": "Study", "area": 14.0},
-            {"entity_id": "climate.dining_room", "name": "Dining Room", "area": 16.0},
-            {"entity_id": "climate.basement", "name": "Basement", "area": 40.0},
-            {"entity_id": "climate.garage", "name": "Garage", "area": 35.0},
-            {"entity_id": "climate.laundry", "name": "Laundry", "area": 10.0},
-        ]
+    # 11-room configuration with realistic thermal properties
+    ZONE_CONFIGS = freeze_configs([
+        {"entity_id": "climate.master_suite", "name": "Master Suite", "area": 20.0},
+        {"entity_id": "climate.bedroom2", "name": "Bedroom 2", "area": 15.0},
+        {"entity_id": "climate.bathroom", "name": "Bathroom", "area": 8.0},
+        {"entity_id": "climate.living_room", "name": "Living Room", "area": 30.0},
+        {"entity_id": "climate.kitchen", "name": "Kitchen", "area": 18.0},
+        {"entity_id": "climate.hallway", "name": "Hallway", "area": 12.0},
+        {"entity_id": "climate.study", "name": "Study", "area": 14.0},
+        {"entity_id": "climate.dining_room", "name": "Dining Room", "area": 16.0},
+        {"entity_id": "climate.basement", "name": "Basement", "area": 40.0},
+        {"entity_id": "climate.garage", "name": "Garage", "area": 35.0},
+        {"entity_id": "climate.laundry", "name": "Laundry", "area": 10.0},
+    ])
 
     def test_heat_propagation_master_suite_warms_adjacent_zones(self):
         """Master Suite heating at full power influences Bedroom2 and Bathroom temps."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Master Suite: Full heating demand (cold start)
         master_event = create_mock_event("climate.master_suite", 16.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(master_event))
+        self._run(controller._async_hvac_demand_change(master_event))
         
         # Bedroom2 starts cold but adjacent to heated Master Suite
         # Simulate partial heat transfer (temp rises passively)
         bedroom2_event = create_mock_event("climate.bedroom2", 17.5, 20.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bedroom2_event))
+        self._run(controller._async_hvac_demand_change(bedroom2_event))
         
         # Bedroom2 should show reduced error due to passive heating from Master Suite
         bedroom2_zone = controller.zones.get("climate.bedroom2")
@@ -429,12 +459,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_hallway_central_hub_influences_all_zones(self):
         """Hallway as central hub: when hallway is heated, all adjacent zones benefit."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Heat hallway (the central hub of the house)
         hallway_event = create_mock_event("climate.hallway", 16.0, 23.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(hallway_event))
+        self._run(controller._async_hvac_demand_change(hallway_event))
         
         # Verify hallway is demanding heat
         hallway_zone = controller.zones.get("climate.hallway")
@@ -443,7 +473,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         # Adjacent zones (Living Room, Kitchen, Study) now have passive temperature increase
         living_room_event = create_mock_event("climate.living_room", 18.5, 22.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(living_room_event))
+        self._run(controller._async_hvac_demand_change(living_room_event))
         
         living_room_zone = controller.zones.get("climate.living_room")
         # Even with heating off, the zone warms via hallway heat transfer
@@ -452,12 +482,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_basement_cold_sink_affects_upper_zones(self):
         """Unheated basement (cold sink) increases demand for zones above it."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Basement stays very cold (unheated, large thermal mass)
         basement_event = create_mock_event("climate.basement", 12.0, 18.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(basement_event))
+        self._run(controller._async_hvac_demand_change(basement_event))
         
         basement_zone = controller.zones.get("climate.basement")
         basement_demand = basement_zone.get_demand_metric()
@@ -466,7 +496,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         # Living Room above basement needs more heat to compensate for basement cold
         living_room_event = create_mock_event("climate.living_room", 19.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(living_room_event))
+        self._run(controller._async_hvac_demand_change(living_room_event))
         
         living_room_zone = controller.zones.get("climate.living_room")
         living_room_demand = living_room_zone.get_demand_metric()
@@ -475,12 +505,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_garage_unheated_cools_kitchen_progressively(self):
         """Unheated garage slowly cools attached kitchen over time."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Initial state: Kitchen at 20.5°C target 22°C
         kitchen_event1 = create_mock_event("climate.kitchen", 20.5, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event1))
+        self._run(controller._async_hvac_demand_change(kitchen_event1))
         
         kitchen_zone = controller.zones.get("climate.kitchen")
         initial_demand = kitchen_zone.get_demand_metric()
@@ -491,7 +521,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         # Simulate progressive temperature drop due to garage proximity
         kitchen_event2 = create_mock_event("climate.kitchen", 20.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event2))
+        self._run(controller._async_hvac_demand_change(kitchen_event2))
         
         updated_demand = kitchen_zone.get_demand_metric()
         # Demand increases as temperature drops despite same target
@@ -499,8 +529,8 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_simultaneous_multi_zone_demand_prioritization(self):
         """With 11 zones, controller correctly prioritizes max demand zone."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start heating multiple zones with different demands
         zones_heating = [
@@ -511,9 +541,10 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
             ("climate.laundry", 16.0, 20.0, 4.0),
         ]
         
-        for entity_id, current, target, _ in zones_heating:
-            event = create_mock_event(entity_id, current, target, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+        self._run_all([
+            controller._async_hvac_demand_change(create_mock_event(entity_id, current, target, 'heating'))
+            for entity_id, current, target, _ in zones_heating
+        ])
         
         # Master Suite has highest demand (23-17=6.0°C error)
         master_zone = controller.zones.get("climate.master_suite")
@@ -531,15 +562,15 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_dining_room_kitchen_thermal_balance(self):
         """Dining room and kitchen reach thermal balance when heating is equal."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Both at similar temperatures with matching targets
         dining_event = create_mock_event("climate.dining_room", 20.0, 22.0, 'heating')
         kitchen_event = create_mock_event("climate.kitchen", 20.0, 22.0, 'heating')
         
-        asyncio.run(controller._async_hvac_demand_change(dining_event))
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(dining_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         dining_zone = controller.zones.get("climate.dining_room")
         kitchen_zone = controller.zones.get("climate.kitchen")
@@ -549,20 +580,20 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_study_hallway_bedroom2_cluster_heating(self):
         """Three interconnected zones (Study, Hallway, Bedroom2) with cascade heating."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start heating Study (connected to Hallway)
         study_event = create_mock_event("climate.study", 17.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(study_event))
+        self._run(controller._async_hvac_demand_change(study_event))
         
         # Hallway warms via Study proximity (passive)
         hallway_event = create_mock_event("climate.hallway", 18.0, 22.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(hallway_event))
+        self._run(controller._async_hvac_demand_change(hallway_event))
         
         # Bedroom2 warms via Hallway (indirect)
         bedroom2_event = create_mock_event("climate.bedroom2", 18.5, 20.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bedroom2_event))
+        self._run(controller._async_hvac_demand_change(bedroom2_event))
         
         study_zone = controller.zones.get("climate.study")
         hallway_zone = controller.zones.get("climate.hallway")
@@ -575,16 +606,16 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_bathroom_master_suite_shared_heat(self):
         """Bathroom shares heat with Master Suite; low demand when suite is heated."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Master Suite cold start
         master_event = create_mock_event("climate.master_suite", 15.0, 23.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(master_event))
+        self._run(controller._async_hvac_demand_change(master_event))
         
         # Bathroom initially cold but receives heat from Master Suite
         bathroom_event = create_mock_event("climate.bathroom", 17.0, 21.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bathroom_event))
+        self._run(controller._async_hvac_demand_change(bathroom_event))
         
         master_zone = controller.zones.get("climate.master_suite")
         bathroom_zone = controller.zones.get("climate.bathroom")
@@ -594,20 +625,24 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_garage_laundry_insulated_from_main_house(self):
         """Garage and Laundry remain cold despite main house heating; less thermal coupling."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Heat main house zones
         living_room_event = create_mock_event("climate.living_room", 18.0, 22.0, 'heating')
         kitchen_event = create_mock_event("climate.kitchen", 18.5, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(living_room_event))
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run_all([
+            controller._async_hvac_demand_change(living_room_event),
+            controller._async_hvac_demand_change(kitchen_event),
+        ])
         
         # Garage and Laundry remain unheated, cold
         garage_event = create_mock_event("climate.garage", 8.0, 15.0, 'idle')
         laundry_event = create_mock_event("climate.laundry", 10.0, 16.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(garage_event))
-        asyncio.run(controller._async_hvac_demand_change(laundry_event))
+        self._run_all([
+            controller._async_hvac_demand_change(garage_event),
+            controller._async_hvac_demand_change(laundry_event),
+        ])
         
         garage_zone = controller.zones.get("climate.garage")
         laundry_zone = controller.zones.get("climate.laundry")
@@ -621,13 +656,14 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_integral_accumulation_across_11_zones(self):
         """Integral term accumulates across 11-zone system over extended period."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start heating first 5 zones
-        for i, zone_config in enumerate(self.zone_configs[:5]):
-            event = create_mock_event(zone_config["entity_id"], 18.0, 22.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+        self._run_all([
+            controller._async_hvac_demand_change(create_mock_event(zone_config["entity_id"], 18.0, 22.0, 'heating'))
+            for zone_config in self.zone_configs[:5]
+        ])
         
         initial_integrals = {eid: controller.zones[eid].pid_integral_sum 
                             for eid in [zc["entity_id"] for zc in self.zone_configs[:5]]}
@@ -636,10 +672,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         self.mock_time.return_value += 3600
         
         # Update again with slight temperature changes (slow heating)
-        for i, zone_config in enumerate(self.zone_configs[:5]):
-            new_temp = 18.0 + (i * 0.2)  # Slow progressive heating
-            event = create_mock_event(zone_config["entity_id"], new_temp, 22.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+        self._run_all([
+            controller._async_hvac_demand_change(
+                create_mock_event(zone_config["entity_id"], 18.0 + (i * 0.2), 22.0, 'heating')  # Slow progressive heating
+            )
+            for i, zone_config in enumerate(self.zone_configs[:5])
+        ])
         
         # Verify integrals have increased
         for eid in [zc["entity_id"] for zc in self.zone_configs[:5]]:
@@ -648,12 +686,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
 
     def test_asymmetric_demand_cascade_through_zones(self):
         """High demand in one zone triggers cascade through thermally connected zones."""
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Extreme demand in Master Suite (emergency cold)
         master_event = create_mock_event("climate.master_suite", 10.0, 23.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(master_event))
+        self._run(controller._async_hvac_demand_change(master_event))
         
         master_zone = controller.zones.get("climate.master_suite")
         master_demand = master_zone.get_demand_metric()
@@ -661,8 +699,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         self.assertEqual(master_demand, 13.0)  # 23 - 10 = 13
         
         # Verify boiler is commanded with significant demand
-        call_args = self.mock_hass.services.async_call.call_args
-        flow_temp = call_args[0][2]['value']
+        flow_temp = self._last_flow_temp
         
         # Flow temp should be high (PID = 6.5, so 40 + 6.5 = 46.5)
         # and certainly greater than the base 40°C setpoint
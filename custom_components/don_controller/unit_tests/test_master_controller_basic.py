@@ -34,17 +34,19 @@ Tests fundamental PID control logic with simple 2-zone setup:
 
 import unittest
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import MagicMock, patch
 import sys
 import os
+from typing import ClassVar
 
 # --- PATH ADJUSTMENT ---
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # --- IMPORTS ---
-from test_helpers import UnifiedTestFixture, MockHASS, create_mock_event
-from zone_wrapper import KP
-from master_controller import MasterController, MIN_FLOW_TEMP, MAX_FLOW_TEMP, OPEN_THERM_FLOW_TEMP_ENTITY
+from test_helpers import UnifiedTestFixture, MockHASS, ServiceCallRecorder, MockEvent, MockState, create_mock_event, freeze_configs
+from zone_wrapper import KP, ZoneWrapper
+from master_controller import MasterController, _DemandIndex, _is_relevant_state_change, MIN_FLOW_TEMP, MAX_FLOW_TEMP, OPEN_THERM_FLOW_TEMP_ENTITY
+from const import DEBOUNCE_DELAY, FLOW_TEMP_DEADBAND, FLOW_TEMP_REFRESH_INTERVAL
 
 
 # =========================================================
@@ -61,15 +63,17 @@ class BaseTestFixture(UnifiedTestFixture):
     - All base logging and time mocking from UnifiedTestFixture
     """
     
+    # Standard 2-zone configuration for basic tests
+    ZONE_CONFIGS: ClassVar[tuple] = freeze_configs([
+        {"entity_id": "climate.test_bedroom", "name": "Bedroom", "area": 10.0},
+        {"entity_id": "climate.test_kitchen", "name": "Kitchen", "area": 15.0},
+    ])
+    
     def setUp(self):
         """Initialize test environment with time mocking and mock HASS instance."""
         super().setUp()
         
-        # Standard 2-zone configuration for basic tests
-        self.zone_configs = [
-            {"entity_id": "climate.test_bedroom", "name": "Bedroom", "area": 10.0},
-            {"entity_id": "climate.test_kitchen", "name": "Kitchen", "area": 15.0},
-        ]
+        self.zone_configs = self.ZONE_CONFIGS
         self.mock_hass = MockHASS()
 
 
@@ -88,13 +92,13 @@ class TestMasterController(BaseTestFixture):
         Scenario: Both zones satisfied, no heating needed.
         Expected: Flow temperature = MIN_FLOW_TEMP (boiler off signal)
         """
-        self.mock_hass.services.async_call = AsyncMock() 
+        self.mock_hass.services.async_call = ServiceCallRecorder() 
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Zone is at target temperature with idle HVAC status
         mock_event = create_mock_event("climate.test_bedroom", 21.0, 20.0, 'idle')
 
-        asyncio.run(controller._async_hvac_demand_change(mock_event))
+        self._run(controller._async_hvac_demand_change(mock_event))
         
         # Verify service call made with minimum flow temperature
         self.mock_hass.services.async_call.assert_called_once_with(
@@ -116,20 +120,19 @@ class TestMasterController(BaseTestFixture):
         - PID output = 3.0 * KP (0.5) = 1.5
         - Flow temp = 40.0 + 1.5 = 41.5°C
         """
-        self.mock_hass.services.async_call = AsyncMock() 
+        self.mock_hass.services.async_call = ServiceCallRecorder() 
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Kitchen: 3°C error (17 current, 20 target)
         kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 20.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         # Bedroom: 1°C error (19 current, 20 target) - lower demand
         bedroom_event = create_mock_event("climate.test_bedroom", 19.0, 20.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
         # Extract commanded flow temperature from service call
-        args, kwargs = self.mock_hass.services.async_call.call_args
-        commanded_flow_temp = args[2]['value']
+        commanded_flow_temp = self._last_flow_temp
         
         # Calculate expected temperature based on Kitchen's 3.0 error
         expected_flow_temp = 40.0 + (3.0 * KP)
@@ -147,17 +150,16 @@ class TestMasterController(BaseTestFixture):
         
         This test ensures boiler safety limits are enforced.
         """
-        self.mock_hass.services.async_call = AsyncMock() 
+        self.mock_hass.services.async_call = ServiceCallRecorder() 
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Extreme cold: 10°C current, 90°C target -> 80°C error
         # P component: 80 * 0.5 = 40, so unclamped would be 40+40=80°C
         mock_event = create_mock_event("climate.test_bedroom", 10.0, 90.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(mock_event))
+        self._run(controller._async_hvac_demand_change(mock_event))
         
         # Extract commanded flow temperature
-        args, kwargs = self.mock_hass.services.async_call.call_args
-        commanded_flow_temp = args[2]['value']
+        commanded_flow_temp = self._last_flow_temp
         
         # Verify clamping at maximum
         self.assertEqual(commanded_flow_temp, MAX_FLOW_TEMP, 
@@ -185,27 +187,25 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
         Expected: Flow temperature decreases with reduced error
         (5.0°C error -> 1.5°C error means proportional flow temp decrease)
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Morning: High temperature error from cold start
         morning_event = create_mock_event("climate.test_bedroom", 16.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(morning_event))
+        self._run(controller._async_hvac_demand_change(morning_event))
         
-        morning_args = self.mock_hass.services.async_call.call_args[0]
-        morning_flow_temp = morning_args[2]['value']
+        morning_flow_temp = self._last_flow_temp
         
         # Reset controller for afternoon test (avoids integral wind-up)
         self.mock_hass.services.async_call.reset_mock()
         self.mock_time.return_value += 3600
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        controller.reset_pid_state()
         
         # Afternoon: Solar gain reduces error (from 5.0 to 1.5)
         afternoon_event = create_mock_event("climate.test_bedroom", 19.5, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(afternoon_event))
+        self._run(controller._async_hvac_demand_change(afternoon_event))
         
-        afternoon_args = self.mock_hass.services.async_call.call_args[0]
-        afternoon_flow_temp = afternoon_args[2]['value']
+        afternoon_flow_temp = self._last_flow_temp
         
         # Verify demand reduction
         self.assertGreater(morning_flow_temp, afternoon_flow_temp,
@@ -223,25 +223,24 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
         
         Expected: Flow temperature command changes to reflect Kitchen's error (4°C)
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Morning: Bedroom cold (5°C error)
         bedroom_event = create_mock_event("climate.test_bedroom", 16.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
         # Mid-morning: Bedroom warms via heater
         self.mock_time.return_value += 900  # 15 min
         bedroom_event = create_mock_event("climate.test_bedroom", 20.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
         # Now Kitchen becomes coldest (4°C error)
         kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         # Extract final command (should be based on Kitchen's error)
-        args = self.mock_hass.services.async_call.call_args[0]
-        final_temp = args[2]['value']
+        final_temp = self._last_flow_temp
         
         expected_kitchen_temp = 40.0 + (4.0 * KP)  # kitchen error 4.0
         self.assertAlmostEqual(final_temp, expected_kitchen_temp, delta=1.0,
@@ -256,7 +255,7 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
         
         Expected: Flow temperature commands decrease monotonically
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         flow_temps = []
@@ -265,15 +264,14 @@ class TestMasterControllerSunnyDay(BaseTestFixture):
         for i, current_temp in enumerate(current_temps):
             # Reset controller each hour to avoid integral accumulation
             if i > 0:
-                controller = MasterController(self.mock_hass, self.zone_configs)
+                controller.reset_pid_state()
                 self.mock_hass.services.async_call.reset_mock()
             
             # Create heating event
             event = create_mock_event("climate.test_bedroom", current_temp, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
             
-            args = self.mock_hass.services.async_call.call_args[0]
-            flow_temps.append(args[2]['value'])
+            flow_temps.append(self._last_flow_temp)
             
             self.mock_time.return_value += 3600
         
@@ -302,7 +300,7 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         Scenario: Consistent 3°C error across multiple hourly updates
         Expected: Boiler remains active with consistent flow temperature
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         flow_temps = []
@@ -310,10 +308,9 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         # Simulate 4 hours of rainy day: persistent demand
         for hour in range(4):
             event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
             
-            args = self.mock_hass.services.async_call.call_args[0]
-            flow_temp = args[2]['value']
+            flow_temp = self._last_flow_temp
             flow_temps.append(flow_temp)
             
             self.mock_time.return_value += 3600
@@ -330,20 +327,20 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         Scenario: Both zones at 17°C, target 21°C (4°C error each)
         Expected: Same flow temperature command regardless of which zone is processed
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Bedroom: 4°C error
         bedroom_event = create_mock_event("climate.test_bedroom", 17.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
         
-        first_call_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        first_call_temp = self._last_flow_temp
         
         # Kitchen: same 4°C error
         kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
-        second_call_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        second_call_temp = self._last_flow_temp
         
         # Should command identical flow temps for equal errors
         self.assertAlmostEqual(first_call_temp, second_call_temp, delta=0.5,
@@ -360,26 +357,26 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         
         Expected: Flow temperature adjusts to Kitchen's 2.5°C error
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Both zones initially cold
         bedroom_event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
         kitchen_event = create_mock_event("climate.test_kitchen", 18.0, 21.0, 'heating')
         
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
-        first_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        self._run(controller._async_hvac_demand_change(bedroom_event))
+        first_temp = self._last_flow_temp
         
         # Bedroom reaches target (satisfied)
         self.mock_time.return_value += 1800
         bedroom_satisfied = create_mock_event("climate.test_bedroom", 21.0, 21.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bedroom_satisfied))
+        self._run(controller._async_hvac_demand_change(bedroom_satisfied))
         
         # Kitchen still needs heating
         kitchen_event = create_mock_event("climate.test_kitchen", 18.5, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
-        second_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        second_temp = self._last_flow_temp
         
         # Verify demand reduced due to Kitchen's smaller error
         self.assertGreater(second_temp, MIN_FLOW_TEMP,
@@ -395,26 +392,27 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         Scenario: 5 updates over 50 minutes, each increasing by 0.2°C
         Expected: Decreasing flow temperature as error reduces (5.0 -> 4.2)
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Start with large error
         event = create_mock_event("climate.test_bedroom", 16.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(event))
+        self._run(controller._async_hvac_demand_change(event))
         
-        initial_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        initial_temp = self._last_flow_temp
         
-        # Simulate 5 updates with gradual warming (create fresh controller each time)
+        # Clear the bedroom's PID history before each update so only P changes (no integral)
+        bedroom = controller.zones["climate.test_bedroom"]
         for i in range(5):
-            controller = MasterController(self.mock_hass, self.zone_configs)
+            bedroom.reset_pid_state()
             self.mock_hass.services.async_call.reset_mock()
             
             self.mock_time.return_value += 600  # 10 minutes
             current = 16.0 + (i * 0.2)  # Increase by 0.2°C each update
             event = create_mock_event("climate.test_bedroom", current, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
-        final_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        final_temp = self._last_flow_temp
         
         # Verify decreasing demand (error: 5.0 -> 4.2)
         self.assertLess(final_temp, initial_temp,
@@ -429,12 +427,12 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         
         Formula: I_sum accumulates error over time -> boosts output for persistent error
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Start with persistent 2°C error
         event1 = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(event1))
+        self._run(controller._async_hvac_demand_change(event1))
         
         zone = controller.zones["climate.test_bedroom"]
         
@@ -442,7 +440,7 @@ class TestMasterControllerRainyDay(BaseTestFixture):
         for hour in range(2):
             self.mock_time.return_value += 3600  # +1 hour each iteration
             event = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
         # Verify integral accumulation
         self.assertGreater(zone.pid_integral_sum, 0,
@@ -471,19 +469,19 @@ class TestMasterControllerTransitions(BaseTestFixture):
         
         Expected: Boiler demand increases as temperature drops
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # Sunny afternoon: minimal error, low demand
         sunny_event = create_mock_event("climate.test_bedroom", 20.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(sunny_event))
-        sunny_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        self._run(controller._async_hvac_demand_change(sunny_event))
+        sunny_temp = self._last_flow_temp
         
         # Evening: temperature drops, demand increases
         self.mock_time.return_value += 7200  # 2 hours later
         rainy_event = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(rainy_event))
-        rainy_temp = self.mock_hass.services.async_call.call_args[0][2]['value']
+        self._run(controller._async_hvac_demand_change(rainy_event))
+        rainy_temp = self._last_flow_temp
         
         # Verify demand increase
         self.assertLess(sunny_temp, rainy_temp,
@@ -499,30 +497,825 @@ class TestMasterControllerTransitions(BaseTestFixture):
         
         Expected: Boiler quickly turns ON with significant flow temperature
         """
-        self.mock_hass.services.async_call = AsyncMock()
+        self.mock_hass.services.async_call = ServiceCallRecorder()
         controller = MasterController(self.mock_hass, self.zone_configs)
         
         # All zones satisfied
         bedroom_event = create_mock_event("climate.test_bedroom", 21.0, 21.0, 'idle')
         kitchen_event = create_mock_event("climate.test_kitchen", 21.0, 21.0, 'idle')
         
-        asyncio.run(controller._async_hvac_demand_change(bedroom_event))
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         # Verify boiler OFF
-        off_call = self.mock_hass.services.async_call.call_args[0][2]['value']
+        off_call = self._last_flow_temp
         self.assertEqual(off_call, MIN_FLOW_TEMP,
                         "All zones satisfied: boiler should be OFF")
         
         # Sudden demand (door opens)
         self.mock_time.return_value += 1800
         demand_event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(demand_event))
+        self._run(controller._async_hvac_demand_change(demand_event))
         
-        on_call = self.mock_hass.services.async_call.call_args[0][2]['value']
+        on_call = self._last_flow_temp
         self.assertGreater(on_call, MIN_FLOW_TEMP + 5,
                           "Sudden demand must turn boiler ON with significant output")
 
 
+# =========================================================
+# EVENT COALESCING TESTS
+# =========================================================
+
+class TestMasterControllerCoalescing(BaseTestFixture):
+    """
+    Test that redundant work is dropped on bursts of state changes:
+    - Unchanged flow temperatures are not re-sent to the boiler
+    - State changes that do not touch the control inputs are ignored
+    - Debounced controllers recalculate once per burst of events
+    """
+    
+    def test_unchanged_flow_temp_skips_service_call(self):
+        """
+        Test that the boiler is not re-commanded when the flow temperature is unchanged.
+        
+        Scenario: The same heating event arrives twice (sensor re-reporting).
+        Expected: Only the first event results in a service call.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
+        self._run(controller._async_hvac_demand_change(event))
+        self._run(controller._async_hvac_demand_change(event))
+        
+        self.assertEqual(self.mock_hass.services.async_call.call_count, 1,
+                         "Identical flow temperature must only be sent once")
+
+    def test_insignificant_change_skips_recalculation(self):
+        """
+        Test that sensor jitter updates the zone but does not trigger a recalculation.
+
+        Scenario: Bedroom reports 18.0°C, then 18.05°C (below sensor precision).
+        Expected: Zone reading updated, _compute_flow_temp runs only once.
+        """
+        controller = MasterController(self.mock_hass, self.zone_configs)
+
+        with patch.object(MasterController, '_compute_flow_temp', return_value=MIN_FLOW_TEMP) as recalc:
+            self._run(controller._async_hvac_demand_change(
+                create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')))
+            self._run(controller._async_hvac_demand_change(
+                create_mock_event("climate.test_bedroom", 18.05, 21.0, 'heating')))
+
+        self.assertEqual(recalc.call_count, 1)
+        self.assertAlmostEqual(controller.zones["climate.test_bedroom"].current_temp, 18.05)
+
+    def test_event_batch_recalculates_once(self):
+        """
+        Test that a batch of zone events results in a single boiler command.
+        
+        Scenario: Bedroom (error 2.0) and Kitchen (error 4.0) report in one batch.
+        Expected: One service call, based on the Kitchen's larger error.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        self._run(controller._async_hvac_demand_change_batch([
+            create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating'),
+            create_mock_event("climate.test_kitchen", 17.0, 21.0, 'heating'),
+        ]))
+        
+        self.mock_hass.services.async_call.assert_called_once()
+        self.assertAlmostEqual(self._last_flow_temp, 40.0 + 4.0 * KP, delta=0.5)
+
+    def test_flow_temp_change_within_deadband_skips_service_call(self):
+        """
+        Test that flow temperature changes smaller than FLOW_TEMP_DEADBAND are not sent,
+        while larger changes are.
+        
+        Scenario: Boiler commanded to 45.0°C, then 45.05°C (jitter), then 46.0°C.
+        Expected: Two service calls (45.0°C and 46.0°C).
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        self._run(controller.async_set_opentherm_flow_temp(45.0 + FLOW_TEMP_DEADBAND / 2))
+        self._run(controller.async_set_opentherm_flow_temp(46.0))
+        
+        commanded = self._commanded_flow_temps
+        self.assertEqual(commanded, [45.0, 46.0],
+                         "Only changes of at least FLOW_TEMP_DEADBAND must reach the boiler")
+    
+    def test_unchanged_flow_temp_refreshed_after_interval(self):
+        """
+        Test that an unchanged flow temperature is re-sent once the refresh interval has passed.
+        
+        Scenario: Boiler commanded to 45.0°C three times; the last after FLOW_TEMP_REFRESH_INTERVAL.
+        Expected: Two service calls (initial command and periodic refresh).
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        self.mock_time.return_value += FLOW_TEMP_REFRESH_INTERVAL / 2
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        self.mock_time.return_value += FLOW_TEMP_REFRESH_INTERVAL
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        
+        self.assertEqual(self.mock_hass.services.async_call.call_count, 2,
+                         "Unchanged flow temperature must be refreshed after the interval")
+
+    def test_forced_flow_temp_bypasses_deadband(self):
+        """
+        Test that force=True sends a command even when it matches the last one.
+
+        Scenario: Boiler commanded to 45.0°C, then 45.0°C again with force=True.
+        Expected: Two service calls.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        self._run(controller.async_set_opentherm_flow_temp(45.0, force=True))
+
+        self.assertEqual(self._commanded_flow_temps, [45.0, 45.0],
+                         "A forced command must reach the boiler")
+
+    def test_failed_service_call_is_retried(self):
+        """
+        Test that a flow temperature whose service call failed is not treated as sent.
+        
+        Scenario: First service call raises, the same flow temperature is commanded again.
+        Expected: The second command is sent instead of being skipped as unchanged.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder(side_effect=[RuntimeError("unavailable"), None])
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        with self.assertRaises(RuntimeError):
+            self._run(controller.async_set_opentherm_flow_temp(45.0))
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        
+        self.assertEqual(self.mock_hass.services.async_call.call_count, 2,
+                         "A failed command must be resent on the next recalculation")
+    
+    def test_irrelevant_state_change_is_filtered(self):
+        """
+        Test that events which do not change the control inputs are filtered out.
+        
+        Scenario: Bedroom re-reports identical temperatures with only friendly_name changed,
+        then reports a new current temperature.
+        Expected: The first event is rejected by the filter, the second one passes it.
+        """
+        attributes = {'current_temperature': 18.0, 'temperature': 21.0, 'hvac_action': 'heating'}
+        old_state = MockState("climate.test_bedroom", attributes=attributes)
+        
+        event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
+        event.data['new_state'].attributes['friendly_name'] = "Bedroom"
+        event.data['old_state'] = old_state
+        self.assertFalse(_is_relevant_state_change(event.data),
+                         "Attribute-only change must not reach the handler")
+        
+        event = create_mock_event("climate.test_bedroom", 17.0, 21.0, 'heating')
+        event.data['old_state'] = old_state
+        self.assertTrue(_is_relevant_state_change(event.data),
+                        "Temperature change must reach the handler")
+        
+        # First report of an entity (no old state) is always relevant
+        event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
+        self.assertTrue(_is_relevant_state_change(event.data))
+    
+    def test_debounce_burst_arms_single_timer(self):
+        """
+        Test that events arriving within the debounce window extend the pending timer
+        instead of creating a new one per event.
+        
+        Scenario: Five bedroom updates in a burst, then the zones go quiet.
+        Expected: One timer armed by the burst, one re-arm for the extended window, one command.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        
+        async def fire_burst():
+            loop = asyncio.get_running_loop()
+            self.mock_hass.loop = loop
+            self.mock_hass.async_create_task = loop.create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.01)
+            
+            def debounce_timers(call_at):
+                return [c for c in call_at.call_args_list if c[0][1] == controller._run_debounced_recompute]
+            
+            with patch.object(loop, 'call_at', wraps=loop.call_at) as call_at:
+                for current_temp in (17.0, 17.2, 17.4, 17.6, 17.8):
+                    event = create_mock_event("climate.test_bedroom", current_temp, 21.0, 'heating')
+                    await controller._async_hvac_demand_change(event)
+                
+                self.assertEqual(len(debounce_timers(call_at)), 1, "A burst must arm a single timer")
+                
+                await asyncio.sleep(0.05)
+                self.assertEqual(len(debounce_timers(call_at)), 2, "Extended window is re-armed once")
+        
+        self._run(fire_burst())
+        
+        self.mock_hass.services.async_call.assert_called_once()
+    
+    def test_flow_temp_clamped_to_safe_limits(self):
+        """
+        Test that out-of-range and NaN flow temperatures are clamped before sending.
+        
+        Scenario: Boiler commanded to 120°C, -10°C, then NaN.
+        Expected: MAX_FLOW_TEMP, then MIN_FLOW_TEMP; NaN resolves to MIN_FLOW_TEMP (deduped).
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        self._run(controller.async_set_opentherm_flow_temp(120.0))
+        self._run(controller.async_set_opentherm_flow_temp(-10.0))
+        self._run(controller.async_set_opentherm_flow_temp(float('nan')))
+        
+        commanded = self._commanded_flow_temps
+        self.assertEqual(commanded, [MAX_FLOW_TEMP, MIN_FLOW_TEMP],
+                         "Flow temperature must stay within MIN_FLOW_TEMP..MAX_FLOW_TEMP")
+    
+    def test_debounced_recalculation_dispatches_command_on_own_task(self):
+        """
+        Test that debounced recalculations hand the boiler write off to a separate task.
+        
+        Scenario: The debounce timer fires with the bedroom demanding heat.
+        Expected: The command is scheduled via hass.async_create_task, not awaited inline.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        self.mock_hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.5)
+        
+        zone = controller.zones["climate.test_bedroom"]
+        zone.update_from_state(create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating').data['new_state'])
+        controller._demand_index_by_zone[zone.entity_id].update(zone)
+        controller._run_debounced_recompute()
+        
+        self.mock_hass.async_create_task.assert_called_once()
+        self.mock_hass.services.async_call.assert_not_called()
+
+    def test_listener_debounces_events_into_one_dispatched_command(self):
+        """
+        Test the production listener path as __init__.py configures it (debounce_delay=DEBOUNCE_DELAY).
+        
+        Scenario: The state listener receives a bedroom and a kitchen update plus an
+        attribute-only re-report, then the zones go quiet.
+        Expected: No command until the debounce delay has passed, then one command
+        from the kitchen's 3°C error, written by the batcher task.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        
+        async def listen():
+            loop = asyncio.get_running_loop()
+            self.mock_hass.loop = loop
+            self.mock_hass.async_create_task = loop.create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=DEBOUNCE_DELAY)
+            
+            bedroom = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
+            controller._handle_state_changed(bedroom)
+            controller._handle_state_changed(create_mock_event("climate.test_kitchen", 18.0, 21.0, 'heating'))
+            
+            renamed = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
+            renamed.data['new_state'].attributes['friendly_name'] = "Bedroom"
+            renamed.data['old_state'] = bedroom.data['new_state']
+            controller._handle_state_changed(renamed)
+            
+            await asyncio.sleep(0)
+            self.mock_hass.services.async_call.assert_not_called()
+            
+            await asyncio.sleep(DEBOUNCE_DELAY + 0.1)
+            self.assertIsNone(controller._flush_task)
+        
+        self._run(listen())
+        
+        self.mock_hass.services.async_call.assert_called_once()
+        self.assertAlmostEqual(self._last_flow_temp, 40.0 + (3.0 * KP), delta=0.5)
+    
+    def test_failed_dispatched_write_is_logged_not_raised(self):
+        """
+        Test that a failing boiler write in the fire-and-forget batcher does not escape its task.
+        
+        Scenario: Debounced controller dispatches 45°C, the service call raises, then 45°C is dispatched again.
+        Expected: The error is logged, the flush task ends cleanly and the value is resent.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder(side_effect=[RuntimeError("unavailable")])
+        
+        async def dispatch():
+            self.mock_hass.async_create_task = asyncio.get_running_loop().create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.5)
+            
+            with self.assertLogs("don_controller", level="ERROR"):
+                controller._dispatch_flow_temp(45.0)
+                flush_task = controller._flush_task
+                await flush_task
+            self.assertIsNone(flush_task.exception())
+            self.assertIsNone(controller._flush_task)
+            
+            controller._dispatch_flow_temp(45.0)
+            await controller._flush_task
+        
+        self._run(dispatch())
+        
+        self.assertEqual(self._commanded_flow_temps, [45.0, 45.0],
+                         "A failed write must not block the next dispatch")
+    
+    def test_cancelled_flush_keeps_newer_flush_task(self):
+        """
+        Test that a flush task cancelled mid-write does not clear the slot of a newer one.
+
+        Scenario: 45°C is being written when the controller stops listening, then 50°C and 55°C are dispatched.
+        Expected: The second flush task keeps the slot and writes 50°C then 55°C, never two writes at once.
+        """
+        sent = []
+        in_flight = []
+        max_in_flight = []
+
+        async def slow_call(domain, service, service_data=None, blocking=False):
+            value = service_data['value']
+            sent.append(value)
+            in_flight.append(value)
+            max_in_flight.append(len(in_flight))
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                in_flight.remove(value)
+
+        self.mock_hass.services.async_call = slow_call
+
+        async def dispatch():
+            self.mock_hass.async_create_task = asyncio.get_running_loop().create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.5)
+
+            controller._dispatch_flow_temp(45.0)
+            await asyncio.sleep(0)
+            await controller.async_stop_listening()
+            controller._dispatch_flow_temp(50.0)
+            flush_task = controller._flush_task
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            self.assertIs(controller._flush_task, flush_task,
+                          "The cancelled flush must not clear the newer task's slot")
+
+            controller._dispatch_flow_temp(55.0)
+            await asyncio.sleep(0.05)
+            self.assertIsNone(controller._flush_task)
+
+        self._run(dispatch())
+
+        self.assertEqual(sent, [45.0, 50.0, 55.0])
+        self.assertEqual(max(max_in_flight), 1)
+    
+    def test_dispatched_commands_keep_only_latest_value(self):
+        """
+        Test that the command batcher allows one write in flight and drops superseded values.
+
+        Scenario: 45°C is being written when 50°C and then 55°C are dispatched.
+        Expected: Two service calls (45°C, 55°C), never two writes at once.
+        """
+        sent = []
+        in_flight = []
+        max_in_flight = []
+
+        async def slow_call(domain, service, service_data=None, blocking=False):
+            value = service_data['value']
+            sent.append(value)
+            in_flight.append(value)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(value)
+
+        self.mock_hass.services.async_call = slow_call
+
+        async def dispatch():
+            self.mock_hass.async_create_task = asyncio.get_running_loop().create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.5)
+
+            controller._dispatch_flow_temp(45.0)
+            await asyncio.sleep(0)
+            controller._dispatch_flow_temp(50.0)
+            controller._dispatch_flow_temp(55.0)
+            await asyncio.sleep(0.05)
+            self.assertIsNone(controller._flush_task)
+
+        self._run(dispatch())
+
+        self.assertEqual(sent, [45.0, 55.0])
+        self.assertEqual(max(max_in_flight), 1)
+
+    def test_unchanged_dispatch_creates_no_task(self):
+        """
+        Test that dispatching the flow temperature the boiler already has schedules nothing.
+        
+        Scenario: 45°C is sent, then 45°C is dispatched from an event callback with no write in flight.
+        Expected: No flush task is created.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        self.mock_hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.5)
+        
+        self._run(controller.async_set_opentherm_flow_temp(45.0))
+        controller._dispatch_flow_temp(45.0)
+        
+        self.mock_hass.async_create_task.assert_not_called()
+        self.assertIsNone(controller._pending_flow_temp)
+    
+    def test_unknown_entity_is_ignored(self):
+        """
+        Test that events for entities the controller does not monitor are dropped.
+        
+        Scenario: A state change arrives for an unconfigured climate entity.
+        Expected: No boiler recalculation, a warning is logged.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        event = create_mock_event("climate.unknown_room", 15.0, 21.0, 'heating')
+        with self.assertLogs("don_controller", level="WARNING") as captured:
+            self._run(controller._async_hvac_demand_change(event))
+        
+        self.mock_hass.services.async_call.assert_not_called()
+        self.assertIn("climate.unknown_room", captured.output[0])
+    
+    def test_unavailable_entity_is_skipped(self):
+        """
+        Test that unavailable entities do not feed their readings into the controller.
+        
+        Scenario: Bedroom goes unavailable twice in a row, then reports heating again.
+        Expected: No command while unavailable (logged once), normal command afterwards.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        unavailable = MockState("climate.test_bedroom", attributes={'state': 'unavailable'})
+        event = MockEvent(data={'entity_id': "climate.test_bedroom", 'new_state': unavailable})
+        with self.assertLogs("don_controller", level="INFO") as captured:
+            self._run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
+        
+        self.mock_hass.services.async_call.assert_not_called()
+        self.assertEqual(len([line for line in captured.output if "unavailable" in line]), 1,
+                         "Unavailability must be logged once, not on every event")
+        
+        event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
+        self._run(controller._async_hvac_demand_change(event))
+        
+        self.mock_hass.services.async_call.assert_called_once()
+    
+    def test_debounce_coalesces_event_burst(self):
+        """
+        Test that a burst of state changes triggers a single recalculation.
+        
+        Scenario: Three bedroom updates arrive within the debounce window.
+        Expected: No command during the burst, then one command based on the last state.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        
+        async def fire_burst():
+            loop = asyncio.get_running_loop()
+            self.mock_hass.loop = loop
+            self.mock_hass.async_create_task = loop.create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.01)
+            
+            for current_temp in (17.0, 17.5, 18.0):
+                event = create_mock_event("climate.test_bedroom", current_temp, 21.0, 'heating')
+                await controller._async_hvac_demand_change(event)
+            
+            # Nothing commanded while events are still arriving
+            self.mock_hass.services.async_call.assert_not_called()
+            
+            # Let the debounce timer fire and the recalculation task complete
+            await asyncio.sleep(0.05)
+        
+        self._run(fire_burst())
+        
+        self.mock_hass.services.async_call.assert_called_once()
+        commanded_flow_temp = self._last_flow_temp
+        self.assertAlmostEqual(commanded_flow_temp, 40.0 + (3.0 * KP), delta=0.5,
+                               msg="Command must reflect the last state of the burst (3°C error)")
+
+
+# =========================================================
+# TRV MITIGATION TESTS
+# =========================================================
+
+class TestMasterControllerTRV(BaseTestFixture):
+    """Test that TRV opening events reach the zone they belong to."""
+    
+    # Track a TRV on the kitchen zone
+    ZONE_CONFIGS = freeze_configs([
+        BaseTestFixture.ZONE_CONFIGS[0],
+        {**BaseTestFixture.ZONE_CONFIGS[1], "trv_entity_id": "number.kitchen_trv_opening"},
+    ])
+    
+    def test_trv_event_boosts_owning_zone(self):
+        """
+        Test that a TRV closing boosts the demand of its zone.
+        
+        Scenario: Bedroom error 2°C, kitchen error 1.5°C; kitchen TRV closes to 50%.
+        Expected: Kitchen demand becomes 3.0 (1.5 × 2) and takes over the boiler decision.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        self._run(controller._async_hvac_demand_change(
+            create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')))
+        self._run(controller._async_hvac_demand_change(
+            create_mock_event("climate.test_kitchen", 19.5, 21.0, 'heating')))
+        
+        trv_state = MockState("number.kitchen_trv_opening", attributes={'state': 50})
+        self._run(controller._async_hvac_demand_change(
+            MockEvent(data={'entity_id': "number.kitchen_trv_opening", 'new_state': trv_state})))
+        
+        kitchen = controller.zones["climate.test_kitchen"]
+        self.assertEqual(kitchen.trv_opening_percent, 50.0)
+        self.assertAlmostEqual(controller._high_priority_demand.best()[1], 3.0,
+                               msg="Max demand must come from the boosted kitchen zone")
+        self.assertIs(controller._high_priority_demand.best()[0], kitchen)
+
+
+# =========================================================
+# LIFECYCLE TESTS
+# =========================================================
+
+class TestMasterControllerLifecycle(BaseTestFixture):
+    """Test listener cleanup when the config entry is unloaded."""
+    
+    def test_stop_listening_unsubscribes_and_cancels_pending_recompute(self):
+        """
+        Test that stopping releases the state listener and any pending debounce timer.
+        
+        Scenario: Controller is listening with a recalculation scheduled, then stopped twice.
+        Expected: Unsubscribe and timer cancel happen exactly once.
+        """
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        unsub = MagicMock()
+        debounce_handle = MagicMock()
+        controller._unsub = unsub
+        controller._debounce_handle = debounce_handle
+        
+        self._run(controller.async_stop_listening())
+        self._run(controller.async_stop_listening())
+        
+        unsub.assert_called_once()
+        debounce_handle.cancel.assert_called_once()
+
+    def test_start_listening_twice_keeps_single_listener(self):
+        """Test that starting an already listening controller does not register a second listener."""
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        unsub = MagicMock()
+        controller._unsub = unsub
+
+        self._run(controller.async_start_listening())
+
+        self.assertIs(controller._unsub, unsub)
+        unsub.assert_not_called()
+
+    def test_reset_restores_fresh_state(self):
+        """
+        Test that reset() makes a used controller behave like a newly constructed one.
+        
+        Scenario: Bedroom heats for an hour (integral accumulates, command sent), then reset.
+        Expected: Zone state and last command cleared; the same event commands the same
+                  flow temperature as on a fresh controller.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        event = create_mock_event("climate.test_bedroom", 18.0, 21.0, 'heating')
+        self._run(controller._async_hvac_demand_change(event))
+        fresh_temp = self._last_flow_temp
+        self.mock_time.return_value += 3600
+        self._run(controller._async_hvac_demand_change(event))
+        
+        controller.reset()
+        zone = controller.zones["climate.test_bedroom"]
+        self.assertEqual(zone.pid_integral_sum, 0.0)
+        self.assertFalse(zone.is_demanding_heat)
+        self.assertEqual(zone.demand_metric, 0.0)
+        self.assertIsNone(controller._last_flow_temp)
+        
+        self.mock_hass.services.async_call.reset_mock()
+        self._run(controller._async_hvac_demand_change(event))
+        self.assertEqual(self._last_flow_temp, fresh_temp)
+    
+    def test_reset_during_flush_keeps_newer_flush_task(self):
+        """
+        Test that reset() mid-write does not let the cancelled flush clear a newer flush task.
+        
+        Scenario: 45°C is being written when the controller is reset, then 50°C is dispatched.
+        Expected: The new flush task keeps the slot until 50°C is written.
+        """
+        async def slow_call(domain, service, service_data=None, blocking=False):
+            await asyncio.sleep(0.01)
+        
+        self.mock_hass.services.async_call = slow_call
+        
+        async def dispatch():
+            self.mock_hass.async_create_task = asyncio.get_running_loop().create_task
+            controller = MasterController(self.mock_hass, self.zone_configs, debounce_delay=0.5)
+            
+            controller._dispatch_flow_temp(45.0)
+            await asyncio.sleep(0)
+            
+            controller.reset()
+            controller._dispatch_flow_temp(50.0)
+            flush_task = controller._flush_task
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            self.assertIs(controller._flush_task, flush_task,
+                          "The cancelled flush must not clear the newer task's slot")
+            
+            await flush_task
+            self.assertIsNone(controller._flush_task)
+        
+        self._run(dispatch())
+
+
+# =========================================================
+# DEMAND INDEX TESTS
+# =========================================================
+
+class TestDemandIndex(UnifiedTestFixture):
+    """
+    Test the per-priority max-demand heap used for zone selection:
+    - Ties are broken by zone configuration order (zones are never compared)
+    - Superseded heap entries are skipped and compacted
+    - Unchanged demand does not grow the heap
+    """
+    
+    def _make_zones(self, count):
+        return [ZoneWrapper(entity_id=f"climate.zone_{i}", name=f"Zone {i}") for i in range(count)]
+    
+    def _set_error(self, zone, error):
+        event = create_mock_event(zone.entity_id, 20.0 - error, 20.0, 'heating' if error > 0 else 'idle')
+        zone.update_from_state(event.data['new_state'])
+    
+    def test_ties_broken_by_configuration_order(self):
+        """Equal demand: the zone configured first wins, whatever the update order."""
+        zones = self._make_zones(3)
+        index = _DemandIndex(zones)
+        for zone in reversed(zones):
+            self._set_error(zone, 2.0)
+            index.update(zone)
+        
+        best_zone, best_demand = index.best()
+        self.assertIs(best_zone, zones[0])
+        self.assertAlmostEqual(best_demand, 2.0)
+        self.assertEqual(index.demanding_count, 3)
+    
+    def test_superseded_entries_skipped_and_compacted(self):
+        """A zone re-keyed many times keeps only its latest demand, and the heap stays bounded."""
+        zones = self._make_zones(2)
+        index = _DemandIndex(zones)
+        self._set_error(zones[1], 1.0)
+        index.update(zones[1])
+        
+        for step in range(100):
+            self._set_error(zones[0], 5.0 - step * 0.03)
+            index.update(zones[0])
+        
+        best_zone, best_demand = index.best()
+        self.assertIs(best_zone, zones[0])
+        self.assertAlmostEqual(best_demand, 2.03)
+        self.assertLessEqual(len(index._heap), 4 * len(zones) + 16)
+        
+        self._set_error(zones[0], 0.0)
+        index.update(zones[0])
+        self.assertIs(index.best()[0], zones[1], "Idle zone must drop out of the selection")
+    
+    def test_unchanged_demand_pushes_nothing(self):
+        """Re-reporting the same demand (or staying idle) leaves the heap untouched."""
+        zones = self._make_zones(2)
+        index = _DemandIndex(zones)
+        self._set_error(zones[0], 1.5)
+        for _ in range(10):
+            index.update(zones[0])
+            index.update(zones[1])
+        
+        self.assertEqual(len(index._heap), 1)
+        self.assertIs(index.best()[0], zones[0])
+        self.assertEqual(index.demanding_count, 1)
+
+
+# =========================================================
+# PRIORITY AGGREGATION TESTS
+# =========================================================
+
+class TestMasterControllerPriorityAggregation(BaseTestFixture):
+    """
+    Test max-demand selection across high- and low-priority zones:
+    - A single low-priority zone cannot trigger the boiler
+    - Two or more low-priority zones are aggregated into the boiler decision
+    - The max-demand zone is re-selected as zone demands change
+    """
+    
+    # Two low-priority zones added to the standard 2-zone configuration
+    ZONE_CONFIGS = BaseTestFixture.ZONE_CONFIGS + freeze_configs([
+        {"entity_id": "climate.guest_room", "name": "Guest Room", "area": 9.0, "priority": 0.3},
+        {"entity_id": "climate.garage", "name": "Garage", "area": 20.0, "priority": 0.2},
+    ])
+
+    def test_zones_partitioned_by_priority_at_init(self):
+        """Test that zones are split into fixed high/low priority groups in configuration order."""
+        controller = MasterController(self.mock_hass, self.zone_configs)
+
+        self.assertEqual(
+            [zone.entity_id for zone in controller._high_priority_zones],
+            ["climate.test_bedroom", "climate.test_kitchen"]
+        )
+        self.assertEqual(
+            [zone.entity_id for zone in controller._low_priority_zones],
+            ["climate.guest_room", "climate.garage"]
+        )
+        self.assertIsInstance(controller._high_priority_zones, tuple)
+
+    def test_single_low_priority_zone_does_not_trigger_boiler(self):
+        """
+        Test that one demanding low-priority zone keeps the boiler OFF.
+        
+        Scenario: Only the guest room (priority 0.3) calls for heat.
+        Expected: Flow temperature = MIN_FLOW_TEMP
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        guest_event = create_mock_event("climate.guest_room", 15.0, 20.0, 'heating')
+        self._run(controller._async_hvac_demand_change(guest_event))
+        
+        commanded_flow_temp = self._last_flow_temp
+        self.assertEqual(commanded_flow_temp, MIN_FLOW_TEMP,
+                         "A single low-priority zone must not trigger the boiler")
+    
+    def test_two_low_priority_zones_trigger_boiler(self):
+        """
+        Test that two demanding low-priority zones are aggregated and trigger the boiler.
+        
+        Scenario: Guest room (5°C error) and garage (2°C error) both call for heat.
+        Expected: Flow temperature based on the guest room's 5°C error.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        guest_event = create_mock_event("climate.guest_room", 15.0, 20.0, 'heating')
+        garage_event = create_mock_event("climate.garage", 13.0, 15.0, 'heating')
+        self._run(controller._async_hvac_demand_change(guest_event))
+        self._run(controller._async_hvac_demand_change(garage_event))
+        
+        commanded_flow_temp = self._last_flow_temp
+        self.assertAlmostEqual(commanded_flow_temp, 40.0 + (5.0 * KP), delta=0.5,
+                               msg="Aggregated low-priority demand must use the largest error")
+    
+    def test_max_demand_reselected_when_leading_zone_satisfied(self):
+        """
+        Test that the next-largest demand takes over when the max-demand zone is satisfied.
+        
+        Scenario:
+        - Kitchen (4°C error) leads, bedroom (2°C error) also heating
+        - Kitchen reaches target and goes idle
+        
+        Expected: Flow temperature follows the bedroom's 2°C error.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        kitchen_event = create_mock_event("climate.test_kitchen", 17.0, 21.0, 'heating')
+        bedroom_event = create_mock_event("climate.test_bedroom", 19.0, 21.0, 'heating')
+        self._run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(bedroom_event))
+        
+        kitchen_satisfied = create_mock_event("climate.test_kitchen", 21.0, 21.0, 'idle')
+        self._run(controller._async_hvac_demand_change(kitchen_satisfied))
+        
+        commanded_flow_temp = self._last_flow_temp
+        self.assertAlmostEqual(commanded_flow_temp, 40.0 + (2.0 * KP), delta=0.5,
+                               msg="Command must fall back to the bedroom's 2°C error")
+
+    
+    def test_selection_does_not_scan_zones(self):
+        """
+        Test that the boiler decision is taken from the demand indices without walking the zones.
+        
+        Scenario: Kitchen (3°C error) plus guest room and garage aggregation (2°C max error),
+        recalculated with debug logging disabled and zone iteration forbidden.
+        Expected: Flow temperature from the kitchen's 3°C error; the zones are never iterated.
+        """
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = MasterController(self.mock_hass, self.zone_configs)
+        
+        for event in (
+            create_mock_event("climate.test_kitchen", 18.0, 21.0, 'heating'),
+            create_mock_event("climate.guest_room", 18.0, 20.0, 'heating'),
+            create_mock_event("climate.garage", 13.0, 15.0, 'heating'),
+        ):
+            controller._hvac_demand_change(event)
+        
+        controller.zones = MagicMock(values=MagicMock(side_effect=AssertionError("zones scanned")))
+        with patch('master_controller._LOGGER.isEnabledFor', return_value=False):
+            self._run(controller.async_set_opentherm_flow_temp(controller._compute_flow_temp()))
+        
+        commanded_flow_temp = self._last_flow_temp
+        self.assertAlmostEqual(commanded_flow_temp, 40.0 + (3.0 * KP), delta=0.5)
+        self.assertEqual(controller.zones.values.call_count, 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -43,16 +43,15 @@ Simulates realistic house thermal topology:
 """
 
 import unittest
-import asyncio
-from unittest.mock import AsyncMock
 import sys
 import os
+from typing import ClassVar
 
 # --- PATH ADJUSTMENT ---
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # --- IMPORTS ---
-from test_helpers import UnifiedTestFixture, MockHASS, create_mock_event
+from test_helpers import UnifiedTestFixture, MockHASS, ServiceCallRecorder, create_mock_event, freeze_configs
 from zone_wrapper import KP
 from master_controller import MasterController, MIN_FLOW_TEMP, MAX_FLOW_TEMP, OPEN_THERM_FLOW_TEMP_ENTITY
 
@@ -69,24 +68,41 @@ class BaseTestFixture(UnifiedTestFixture):
     with various zone sizes and thermal coupling characteristics.
     """
     
+    # 11-zone house configuration with realistic floor areas
+    ZONE_CONFIGS: ClassVar[tuple] = freeze_configs([
+        {"entity_id": "climate.master_suite", "name": "Master Suite", "area": 20.0},
+        {"entity_id": "climate.bedroom2", "name": "Bedroom 2", "area": 15.0},
+        {"entity_id": "climate.bathroom", "name": "Bathroom", "area": 8.0},
+        {"entity_id": "climate.living_room", "name": "Living Room", "area": 30.0},
+        {"entity_id": "climate.kitchen", "name": "Kitchen", "area": 18.0},
+        {"entity_id": "climate.hallway", "name": "Hallway", "area": 12.0},
+        {"entity_id": "climate.study", "name": "Study", "area": 14.0},
+        {"entity_id": "climate.dining_room", "name": "Dining Room", "area": 16.0},
+        {"entity_id": "climate.basement", "name": "Basement", "area": 40.0},
+        {"entity_id": "climate.garage", "name": "Garage", "area": 35.0},
+        {"entity_id": "climate.laundry", "name": "Laundry", "area": 10.0},
+    ])
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One 11-zone controller per test class, built on first use and reset for each test
+        cls._cached_controller = None
+    
+    def _get_controller(self) -> MasterController:
+        """Return the class's shared controller, reset and bound to this test's mock HASS."""
+        controller = type(self)._cached_controller
+        if controller is None:
+            controller = type(self)._cached_controller = MasterController(self.mock_hass, self.zone_configs)
+        controller.hass = self.mock_hass
+        controller.reset()
+        return controller
+    
     def setUp(self):
         """Initialize 11-zone test environment with unified base setup."""
         super().setUp()
         
-        # 11-zone house configuration with realistic floor areas
-        self.zone_configs = [
-            {"entity_id": "climate.master_suite", "name": "Master Suite", "area": 20.0},
-            {"entity_id": "climate.bedroom2", "name": "Bedroom 2", "area": 15.0},
-            {"entity_id": "climate.bathroom", "name": "Bathroom", "area": 8.0},
-            {"entity_id": "climate.living_room", "name": "Living Room", "area": 30.0},
-            {"entity_id": "climate.kitchen", "name": "Kitchen", "area": 18.0},
-            {"entity_id": "climate.hallway", "name": "Hallway", "area": 12.0},
-            {"entity_id": "climate.study", "name": "Study", "area": 14.0},
-            {"entity_id": "climate.dining_room", "name": "Dining Room", "area": 16.0},
-            {"entity_id": "climate.basement", "name": "Basement", "area": 40.0},
-            {"entity_id": "climate.garage", "name": "Garage", "area": 35.0},
-            {"entity_id": "climate.laundry", "name": "Laundry", "area": 10.0},
-        ]
+        self.zone_configs = self.ZONE_CONFIGS
         self.mock_hass = MockHASS()
 
 
@@ -126,18 +142,18 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Bedroom2 error < 3.5°C (due to passive heating from Master Suite)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Master Suite: Full heating demand (cold start)
         master_event = create_mock_event("climate.master_suite", 16.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(master_event))
+        self._run(controller._async_hvac_demand_change(master_event))
         
         # Bedroom2: Adjacent to heated Master Suite, receives passive heating
         # Without heat transfer: 20 - 16 = 4°C error
         # With heat transfer: 20 - 17.5 = 2.5°C error (warmed by Master Suite)
         bedroom2_event = create_mock_event("climate.bedroom2", 17.5, 20.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bedroom2_event))
+        self._run(controller._async_hvac_demand_change(bedroom2_event))
         
         bedroom2_zone = controller.zones.get("climate.bedroom2")
         self.assertIsNotNone(bedroom2_zone)
@@ -161,12 +177,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Living Room passive warming despite idle HVAC (error < 5.0°C)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Heat hallway (the central hub)
         hallway_event = create_mock_event("climate.hallway", 16.0, 23.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(hallway_event))
+        self._run(controller._async_hvac_demand_change(hallway_event))
         
         hallway_zone = controller.zones.get("climate.hallway")
         self.assertTrue(hallway_zone.is_demanding_heat)
@@ -177,7 +193,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         # Without heat transfer: 22 - 17 = 5°C error
         # With passive warming: 22 - 18.5 = 3.5°C error
         living_room_event = create_mock_event("climate.living_room", 18.5, 22.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(living_room_event))
+        self._run(controller._async_hvac_demand_change(living_room_event))
         
         living_room_zone = controller.zones.get("climate.living_room")
         
@@ -200,12 +216,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Living Room demand > 2.5°C to overcome basement cooling effect
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Basement: Very cold, unheated (large thermal mass remains cold)
         basement_event = create_mock_event("climate.basement", 12.0, 18.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(basement_event))
+        self._run(controller._async_hvac_demand_change(basement_event))
         
         basement_zone = controller.zones.get("climate.basement")
         basement_demand = basement_zone.get_demand_metric()
@@ -216,7 +232,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         # Living Room above basement needs extra heat to compensate
         living_room_event = create_mock_event("climate.living_room", 19.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(living_room_event))
+        self._run(controller._async_hvac_demand_change(living_room_event))
         
         living_room_zone = controller.zones.get("climate.living_room")
         living_room_demand = living_room_zone.get_demand_metric()
@@ -241,12 +257,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Kitchen demand increases despite same target (2 > 1.5)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Initial: Kitchen at 20.5°C
         kitchen_event1 = create_mock_event("climate.kitchen", 20.5, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event1))
+        self._run(controller._async_hvac_demand_change(kitchen_event1))
         
         kitchen_zone = controller.zones.get("climate.kitchen")
         initial_demand = kitchen_zone.get_demand_metric()
@@ -257,7 +273,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         # Kitchen now loses more heat to colder garage
         kitchen_event2 = create_mock_event("climate.kitchen", 20.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event2))
+        self._run(controller._async_hvac_demand_change(kitchen_event2))
         
         updated_demand = kitchen_zone.get_demand_metric()
         
@@ -278,8 +294,8 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Boiler commands based on Master Suite's highest error (6°C)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Activate 5 zones with different demands
         zones_heating = [
@@ -292,7 +308,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         for entity_id, current, target in zones_heating:
             event = create_mock_event(entity_id, current, target, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
         # Master Suite has highest error
         master_zone = controller.zones.get("climate.master_suite")
@@ -324,15 +340,15 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Errors match exactly (±0.1°C tolerance)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Both at matching conditions
         dining_event = create_mock_event("climate.dining_room", 20.0, 22.0, 'heating')
         kitchen_event = create_mock_event("climate.kitchen", 20.0, 22.0, 'heating')
         
-        asyncio.run(controller._async_hvac_demand_change(dining_event))
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(dining_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         dining_zone = controller.zones.get("climate.dining_room")
         kitchen_zone = controller.zones.get("climate.kitchen")
@@ -357,20 +373,20 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Errors decrease along cascade path (5 > 4 > 1.5)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start heating Study (source of cascade)
         study_event = create_mock_event("climate.study", 17.0, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(study_event))
+        self._run(controller._async_hvac_demand_change(study_event))
         
         # Hallway warms passively via Study proximity
         hallway_event = create_mock_event("climate.hallway", 18.0, 22.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(hallway_event))
+        self._run(controller._async_hvac_demand_change(hallway_event))
         
         # Bedroom2 indirectly warmed (far from Study, closer to Hallway)
         bedroom2_event = create_mock_event("climate.bedroom2", 18.5, 20.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bedroom2_event))
+        self._run(controller._async_hvac_demand_change(bedroom2_event))
         
         study_zone = controller.zones.get("climate.study")
         hallway_zone = controller.zones.get("climate.hallway")
@@ -397,16 +413,16 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: Bathroom error << Master Suite error - 3.0 (significant passive heating)
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Master Suite cold start, full heating demand
         master_event = create_mock_event("climate.master_suite", 15.0, 23.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(master_event))
+        self._run(controller._async_hvac_demand_change(master_event))
         
         # Bathroom receives substantial passive heating
         bathroom_event = create_mock_event("climate.bathroom", 17.0, 21.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(bathroom_event))
+        self._run(controller._async_hvac_demand_change(bathroom_event))
         
         master_zone = controller.zones.get("climate.master_suite")
         bathroom_zone = controller.zones.get("climate.bathroom")
@@ -436,20 +452,20 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         - Garage & Laundry remain much colder than main zones
         - Minimal passive heating effect from main house
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Heat main house zones
         living_room_event = create_mock_event("climate.living_room", 18.0, 22.0, 'heating')
         kitchen_event = create_mock_event("climate.kitchen", 18.5, 22.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(living_room_event))
-        asyncio.run(controller._async_hvac_demand_change(kitchen_event))
+        self._run(controller._async_hvac_demand_change(living_room_event))
+        self._run(controller._async_hvac_demand_change(kitchen_event))
         
         # Garage and Laundry remain cold despite main house heating
         garage_event = create_mock_event("climate.garage", 8.0, 15.0, 'idle')
         laundry_event = create_mock_event("climate.laundry", 10.0, 16.0, 'idle')
-        asyncio.run(controller._async_hvac_demand_change(garage_event))
-        asyncio.run(controller._async_hvac_demand_change(laundry_event))
+        self._run(controller._async_hvac_demand_change(garage_event))
+        self._run(controller._async_hvac_demand_change(laundry_event))
         
         garage_zone = controller.zones.get("climate.garage")
         laundry_zone = controller.zones.get("climate.laundry")
@@ -478,13 +494,13 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         
         Expected: All zone integrals increase after 1 hour of persistent error
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Start heating first 5 zones
         for i, zone_config in enumerate(self.zone_configs[:5]):
             event = create_mock_event(zone_config["entity_id"], 18.0, 22.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
         # Record initial integral sums
         initial_integrals = {
@@ -499,7 +515,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         for i, zone_config in enumerate(self.zone_configs[:5]):
             new_temp = 18.0 + (i * 0.2)  # Progressive heating 0.2°C each
             event = create_mock_event(zone_config["entity_id"], new_temp, 22.0, 'heating')
-            asyncio.run(controller._async_hvac_demand_change(event))
+            self._run(controller._async_hvac_demand_change(event))
         
         # Verify integral accumulation
         for eid in [zc["entity_id"] for zc in self.zone_configs[:5]]:
@@ -524,12 +540,12 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
         - Boiler commanded with high flow temperature (40 + 6.5 = 46.5°C minimum)
         - P component alone: 13.0 * 0.5 = 6.5°C boost
         """
-        self.mock_hass.services.async_call = AsyncMock()
-        controller = MasterController(self.mock_hass, self.zone_configs)
+        self.mock_hass.services.async_call = ServiceCallRecorder()
+        controller = self._get_controller()
         
         # Extreme emergency: Master Suite extremely cold
         master_event = create_mock_event("climate.master_suite", 10.0, 23.0, 'heating')
-        asyncio.run(controller._async_hvac_demand_change(master_event))
+        self._run(controller._async_hvac_demand_change(master_event))
         
         master_zone = controller.zones.get("climate.master_suite")
         master_demand = master_zone.get_demand_metric()
@@ -539,8 +555,7 @@ class TestMultiRoomThermalCoupling(BaseTestFixture):
                         "Master Suite demand should be exactly 13°C error")
         
         # Verify boiler commanded with high demand
-        call_args = self.mock_hass.services.async_call.call_args
-        flow_temp = call_args[0][2]['value']
+        flow_temp = self._last_flow_temp
         
         # Flow temp calculation: base(40) + P(6.5) + I(0) + D(0) = 46.5 minimum
         # Since P=13*0.5=6.5, expected ≈ 46.5
@@ -41,6 +41,7 @@ PID Controller Components:
 - I (Integral): Long-term correction for persistent error
   I_sum accumulates error * time_delta
   I = I_sum * KI (0.01)
+  Anti-windup: I_sum stops growing once the commanded flow temperature saturates
   
 - D (Derivative): Damping based on error rate of change
   D = (error_now - error_prev) / time_delta * KD (0.1)
@@ -58,9 +59,18 @@ Priority System:
 Output: PID = P + I + D (mapped to physical flow temperature by MasterController)
 """
 
-import time
 import logging
-from typing import Optional
+from time import monotonic
+from typing import TYPE_CHECKING, Final, Optional
+
+# Relative import inside Home Assistant; top-level import when loaded as a plain module
+if __package__:
+    from .const import BASE_FLOW_TEMP, MAX_FLOW_TEMP, MIN_FLOW_TEMP
+else:
+    from const import BASE_FLOW_TEMP, MAX_FLOW_TEMP, MIN_FLOW_TEMP
+
+if TYPE_CHECKING:
+    from homeassistant.core import State
 
 # =========================================================
 # PID Tuning Constants
@@ -68,19 +78,64 @@ from typing import Optional
 
 # Proportional gain: How strongly to respond to current error
 # Higher KP = faster response but may overshoot
-KP = 0.5
+KP: Final = 0.5
 
 # Integral gain: How strongly to correct persistent error
 # Higher KI = better steady-state accuracy but may cause oscillation
-KI = 0.01
+KI: Final = 0.01
 
 # Derivative gain: How much to dampen rapid error changes
 # Higher KD = smoother response but may reduce reactivity
-KD = 0.1
+KD: Final = 0.1
+
+# =========================================================
+# Significant Change Thresholds
+# =========================================================
+
+# Smallest changes that are worth a boiler recalculation; anything below is sensor jitter
+# Measured against the readings at the last significant change, so slow drift still adds up
+TEMP_CHANGE_EPSILON = 0.1         # °C, room temperature
+TARGET_CHANGE_EPSILON = 0.05      # °C, setpoint
+TRV_OPENING_CHANGE_EPSILON = 5.0  # %, valve opening
 
 _LOGGER = logging.getLogger("don_controller")
 
 
+def _pid_terms(error: float, last_error: float, integral_sum: float,
+               time_delta: float) -> tuple[float, float, float]:
+    """
+    Return the (P, I, D) terms for one PID step.
+    
+    Pure scalar arithmetic on local floats (no attribute access or logging), so
+    it can be exercised and profiled apart from the zone's state bookkeeping.
+    D is 0.0 when no time has elapsed.
+    """
+    derivative = (error - last_error) / time_delta * KD if time_delta > 0 else 0.0
+    return error * KP, integral_sum * KI, derivative
+
+
+def _integrate(error: float, integral_sum: float, time_delta: float) -> float:
+    """
+    Return the integral sum after one step, with conditional integration.
+    
+    While the flow temperature this step would command is saturated in the
+    error's direction, the integral only grows up to the value that reaches the
+    limit (never past it), so it does not keep winding up during startup or
+    sustained errors and unwinds as soon as the error reverses.
+    
+    Saturation is judged on BASE_FLOW_TEMP + P + I only. D is transient: a
+    single fast-changing reading would otherwise freeze the integral against a
+    spike that is gone by the next update.
+    """
+    candidate = integral_sum + error * time_delta
+    flow_temp = BASE_FLOW_TEMP + error * KP + candidate * KI
+    if flow_temp > MAX_FLOW_TEMP and error > 0:
+        candidate = max(integral_sum, candidate - (flow_temp - MAX_FLOW_TEMP) / KI)
+    elif flow_temp < MIN_FLOW_TEMP and error < 0:
+        candidate = min(integral_sum, candidate + (MIN_FLOW_TEMP - flow_temp) / KI)
+    return candidate
+
+
 class ZoneWrapper:
     """
     Wrapper for a Home Assistant thermostat entity with embedded PID controller.
@@ -102,6 +157,34 @@ class ZoneWrapper:
     The MasterController uses this zone's PID output if it has the maximum demand.
     """
 
+    # Fixed attribute layout: no per-instance __dict__ for the (possibly many) zones
+    __slots__ = (
+        "entity_id",
+        "name",
+        "floor_area_m2",
+        "priority",
+        "trv_entity_id",
+        "current_error",
+        "pid_integral_sum",
+        "last_error",
+        "last_update_time",
+        "is_demanding_heat",
+        "target_temp",
+        "last_target_temp",
+        "current_temp",
+        "trv_opening_percent",
+        "trv_boost",
+        "last_pid_output",
+        "last_pid_p",
+        "last_pid_i",
+        "last_pid_d",
+        "demand_metric",
+        "significant_temp",
+        "significant_target_temp",
+        "significant_hvac_action",
+        "significant_trv_opening",
+    )
+
     def __init__(self, entity_id: str, name: str, floor_area_m2: float = 0.0,
                  priority: float = 1.0, trv_entity_id: Optional[str] = None) -> None:
         """
@@ -118,11 +201,11 @@ class ZoneWrapper:
                           Used to mitigate TRV closing effects on thermostat control
                           Home Assistant exposes this as number.entity_opening_percent
         """
-        self.entity_id = entity_id
-        self.name = name
-        self.floor_area_m2 = floor_area_m2
-        self.priority = max(0.0, min(1.0, priority))  # Clamp priority to 0.0-1.0
-        self.trv_entity_id = trv_entity_id
+        self.entity_id: str = entity_id
+        self.name: str = name
+        self.floor_area_m2: float = floor_area_m2
+        self.priority: float = max(0.0, min(1.0, priority))  # Clamp priority to 0.0-1.0
+        self.trv_entity_id: Optional[str] = trv_entity_id
         
         # ========== Runtime State ==========
         # Current temperature error: target - current (positive = too cold)
@@ -135,7 +218,7 @@ class ZoneWrapper:
         # Previous error used for derivative calculation (rate of change)
         self.last_error: float = 0.0
         
-        # Unix timestamp of last state update (for time_delta calculations)
+        # Monotonic clock reading of last state update (for time_delta calculations)
         self.last_update_time: float = 0.0
         
         # Is this zone actively calling for heat? (HVAC action == 'heating')
@@ -155,6 +238,8 @@ class ZoneWrapper:
         # TRVs close in 25% steps: 100%->75%->50%->25%->0%
         # We use this to compensate the error signal when valve is closing
         self.trv_opening_percent: float = 100.0
+        # Demand multiplier for the current opening (1.0 = no boost), recomputed only when it changes
+        self.trv_boost: float = 1.0
         
         # PID output history for Home Assistant export
         # Allows monitoring/debugging of controller behavior
@@ -163,13 +248,23 @@ class ZoneWrapper:
         self.last_pid_i: float = 0.0  # Integral component
         self.last_pid_d: float = 0.0  # Derivative component
         
+        # Demand metric cached on every state/TRV update (read by MasterController per event)
+        self.demand_metric: float = 0.0
+        
+        # Readings as of the last significant change (see update_from_state / update_trv_opening)
+        # hvac_action starts as None so the first climate update is always significant
+        self.significant_temp: float = 0.0
+        self.significant_target_temp: float = 0.0
+        self.significant_hvac_action: Optional[str] = None
+        self.significant_trv_opening: float = 100.0
+        
         _LOGGER.info(
             "Zone %s initialized (entity_id=%s, area=%.1f m², priority=%.2f%s)", 
             self.name, self.entity_id, self.floor_area_m2, self.priority,
             f", TRV={trv_entity_id}" if trv_entity_id else ""
         )
 
-    def update_from_state(self, new_state) -> None:
+    def update_from_state(self, new_state: "State") -> bool:
         """
         Update zone state from Home Assistant climate entity.
         
@@ -186,19 +281,25 @@ class ZoneWrapper:
         
         Args:
             new_state: Home Assistant climate entity state object
+            
+        Returns:
+            bool: True if the change is material (temperature moved more than
+                  TEMP_CHANGE_EPSILON, setpoint more than TARGET_CHANGE_EPSILON,
+                  or HVAC action changed) and the boiler command should be recalculated
         """
         if not new_state:
             _LOGGER.debug("Zone %s: update_from_state called with None state", self.name)
-            return
+            return False
 
         try:
             # Extract temperature readings from climate entity attributes
-            current_temp = float(new_state.attributes.get('current_temperature', 0.0))
-            target_temp = float(new_state.attributes.get('temperature', 0.0))
-            hvac_action = new_state.attributes.get('hvac_action', 'off')
+            attributes = new_state.attributes
+            current_temp = float(attributes.get('current_temperature', 0.0))
+            target_temp = float(attributes.get('temperature', 0.0))
+            hvac_action = attributes.get('hvac_action', 'off')
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Data error for zone %s: %s", self.name, e)
-            return
+            return False
 
         self.current_temp = current_temp
         
@@ -218,41 +319,42 @@ class ZoneWrapper:
         self.last_target_temp = target_temp
         
         # Zone is "demanding heat" only if HVAC is actively heating
-        self.is_demanding_heat = (hvac_action == 'heating')
+        is_demanding_heat = self.is_demanding_heat = (hvac_action == 'heating')
 
         # Calculate temperature error and time elapsed since last update
         new_error = target_temp - current_temp
-        time_now = time.time()
+        # Monotonic clock: wall-clock jumps (NTP, DST) must never feed a negative time_delta into the PID
+        time_now = monotonic()
         time_delta = time_now - self.last_update_time if self.last_update_time else 0
 
         # Log detailed state change for debugging
-        _LOGGER.debug(
-            "Zone %s state update: current=%.1f°C, target=%.1f°C, error=%.1f°C, action=%s, time_delta=%.1fs",
-            self.name, current_temp, target_temp, new_error, hvac_action, time_delta
-        )
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "Zone %s state update: current=%.1f°C, target=%.1f°C, error=%.1f°C, action=%s, time_delta=%.1fs",
+                self.name, current_temp, target_temp, new_error, hvac_action, time_delta
+            )
 
         # Update PID terms when zone is actively heating
-        if self.is_demanding_heat:
+        if is_demanding_heat:
+            previous_error = self.current_error
             
             # ===== Integral Term (I) =====
             # Accumulate error over time for long-term correction
-            # I_sum tracks persistent errors that need integral boost
-            self.pid_integral_sum += new_error * time_delta
-            
-            # Clamp integral to prevent wind-up (saturation)
-            # Wind-up occurs when integrator saturates and continues accumulating
-            # during startup or after sustained errors
-            self.pid_integral_sum = max(-10000.0, min(10000.0, self.pid_integral_sum))
+            # I_sum tracks persistent errors that need integral boost, and stops
+            # growing once the commanded flow temperature saturates (anti-windup)
+            self.pid_integral_sum = _integrate(new_error, self.pid_integral_sum, time_delta)
             
             # ===== Derivative Term (D) Setup =====
             # Store current error for next update's derivative calculation
-            self.last_error = self.current_error
+            self.last_error = previous_error
             
-            _LOGGER.debug(
-                "Zone %s PID state: P_error=%.1f°C, I_sum=%.2f, D_prev=%.1f°C",
-                self.name, new_error, self.pid_integral_sum, self.last_error
-            )
-        else:
+            if debug:
+                _LOGGER.debug(
+                    "Zone %s PID state: P_error=%.1f°C, I_sum=%.2f, D_prev=%.1f°C",
+                    self.name, new_error, self.pid_integral_sum, self.last_error
+                )
+        elif debug:
             # Zone not heating: log state but don't accumulate errors
             _LOGGER.debug(
                 "Zone %s: HVAC action is %s (not heating), demand metrics reset", 
@@ -261,10 +363,31 @@ class ZoneWrapper:
             
         self.current_error = new_error
         self.last_update_time = time_now
+        self.demand_metric = self._compute_demand_metric()
+        
+        # ===== SIGNIFICANT CHANGE GATE =====
+        # PID state above is always updated; only the recalculation is skipped for jitter
+        if (abs(current_temp - self.significant_temp) > TEMP_CHANGE_EPSILON
+                or abs(target_temp - self.significant_target_temp) > TARGET_CHANGE_EPSILON
+                or hvac_action != self.significant_hvac_action):
+            self.significant_temp = current_temp
+            self.significant_target_temp = target_temp
+            self.significant_hvac_action = hvac_action
+            return True
+        return False
 
     def get_demand_metric(self) -> float:
         """
-        Return this zone's heating demand metric with priority weighting and TRV mitigation.
+        Return this zone's heating demand metric (cached at the last state or TRV update).
+        
+        Returns:
+            float: Weighted demand metric used by MasterController to find max-demand zone
+        """
+        return self.demand_metric
+
+    def _compute_demand_metric(self) -> float:
+        """
+        Compute this zone's heating demand metric with priority weighting and TRV mitigation.
         
         Calculation:
         1. Base demand: current error only if zone is actively heating and error > 0
@@ -297,13 +420,14 @@ class ZoneWrapper:
         # - Opening 75% (1 step closed): boost = 1.33 (33% boost)
         # - Opening 50% (half closed): boost = 2.0 (double error)
         # - Opening 25% (mostly closed): boost = 4.0 (quadruple error)
-        if self.trv_opening_percent < 100.0 and self.trv_opening_percent > 0:
-            trv_boost = 100.0 / self.trv_opening_percent
+        trv_boost = self.trv_boost
+        if trv_boost != 1.0:
             demand *= trv_boost
-            _LOGGER.debug(
-                "Zone %s: TRV mitigation - opening=%.0f%%, boost=%.2f, boosted_error=%.2f°C",
-                self.name, self.trv_opening_percent, trv_boost, demand
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Zone %s: TRV mitigation - opening=%.0f%%, boost=%.2f, boosted_error=%.2f°C",
+                    self.name, self.trv_opening_percent, trv_boost, demand
+                )
         
         # Note: Priority-based decision is handled in MasterController via aggregation:
         # - High-priority zones (priority > 0.5) can trigger boiler individually
@@ -335,25 +459,12 @@ class ZoneWrapper:
             float: Total PID output (used to boost flow temperature)
         """
         
-        # ===== P (Proportional) Term =====
-        # Proportional to current error: larger error -> larger output
-        # Provides immediate response to temperature mismatch
-        P = self.current_error * KP
-        
-        # ===== I (Integral) Term =====
-        # Proportional to accumulated error over time
-        # Corrects persistent errors that P alone cannot fix
-        # Example: If zone stays 1°C below target for 1 hour, integral builds up
-        I = self.pid_integral_sum * KI
-        
-        # ===== D (Derivative) Term =====
-        # Proportional to rate of error change
-        # Provides damping: prevents overshoot when error is decreasing rapidly
-        # Example: If temperature rising quickly, D reduces boost to prevent overshoot
-        D = 0.0
-        if time_delta > 0:
-            error_rate_of_change = (self.current_error - self.last_error) / time_delta
-            D = error_rate_of_change * KD
+        # ===== P, I and D Terms =====
+        # P: proportional to current error, immediate response to temperature mismatch
+        # I: proportional to accumulated error, corrects persistent errors P alone cannot fix
+        #    (e.g. zone stays 1°C below target for 1 hour -> integral builds up)
+        # D: proportional to rate of error change, damps overshoot when temperature moves quickly
+        P, I, D = _pid_terms(self.current_error, self.last_error, self.pid_integral_sum, time_delta)
         
         pid_output = P + I + D
         
@@ -363,14 +474,15 @@ class ZoneWrapper:
         self.last_pid_d = D
         self.last_pid_output = pid_output
         
-        _LOGGER.debug(
-            "Zone %s PID calculation: P=%.2f, I=%.2f, D=%.2f, total=%.2f (time_delta=%.1fs)",
-            self.name, P, I, D, pid_output, time_delta
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Zone %s PID calculation: P=%.2f, I=%.2f, D=%.2f, total=%.2f (time_delta=%.1fs)",
+                self.name, P, I, D, pid_output, time_delta
+            )
             
         return pid_output
     
-    def update_trv_opening(self, opening_percent: float) -> None:
+    def update_trv_opening(self, opening_percent: float) -> bool:
         """
         Update TRV valve opening percentage from Home Assistant entity.
         
@@ -383,16 +495,68 @@ class ZoneWrapper:
         
         Args:
             opening_percent: TRV opening percentage (0-100%)
+            
+        Returns:
+            bool: True if the opening moved more than TRV_OPENING_CHANGE_EPSILON
+                  since the last significant change
         """
         if opening_percent != self.trv_opening_percent:
             old_opening = self.trv_opening_percent
             self.trv_opening_percent = max(0.0, min(100.0, opening_percent))
+            # Boost only while partially closed (fully closed = no flow to compensate)
+            self.trv_boost = (
+                100.0 / self.trv_opening_percent if 0.0 < self.trv_opening_percent < 100.0 else 1.0
+            )
             
             if old_opening != self.trv_opening_percent:
                 _LOGGER.debug(
                     "Zone %s: TRV opening changed from %.0f%% to %.0f%%",
                     self.name, old_opening, self.trv_opening_percent
                 )
+                self.demand_metric = self._compute_demand_metric()
+        
+        if abs(self.trv_opening_percent - self.significant_trv_opening) > TRV_OPENING_CHANGE_EPSILON:
+            self.significant_trv_opening = self.trv_opening_percent
+            return True
+        return False
+    
+    def reset_pid_state(self) -> None:
+        """
+        Clear the PID history while keeping the zone's configuration and readings.
+        
+        Zeroes the integral accumulator and derivative memory and forgets the last
+        update time, so the next update starts a fresh time base (no integral over
+        the gap) and always counts as a significant change.
+        """
+        self.pid_integral_sum = 0.0
+        self.last_error = 0.0
+        self.last_update_time = 0.0
+        self.significant_hvac_action = None
+        _LOGGER.debug("Zone %s: PID state reset", self.name)
+    
+    def reset(self) -> None:
+        """
+        Return the zone to its freshly constructed state, keeping only its configuration.
+        
+        Readings, TRV opening, PID history and outputs are cleared, so a wrapper can
+        be reused instead of rebuilt (see MasterController.reset).
+        """
+        self.reset_pid_state()
+        self.current_error = 0.0
+        self.is_demanding_heat = False
+        self.target_temp = 0.0
+        self.last_target_temp = 0.0
+        self.current_temp = 0.0
+        self.trv_opening_percent = 100.0
+        self.trv_boost = 1.0
+        self.last_pid_output = 0.0
+        self.last_pid_p = 0.0
+        self.last_pid_i = 0.0
+        self.last_pid_d = 0.0
+        self.demand_metric = 0.0
+        self.significant_temp = 0.0
+        self.significant_target_temp = 0.0
+        self.significant_trv_opening = 100.0
     
     def export_pid_state(self) -> dict:
         """